@@ -83,10 +83,12 @@ def run() -> int:
     else:
         cpu = len(config.scenario_files)
 
-    with Pool(cpu) as p:
-        results = p.map(safe_sim, sim_args)
+    # scenarios can have very different run times, so hand them to workers one at a time
+    # instead of in pre-assigned chunks; each worker exits after its scenario to release memory
+    with Pool(cpu, maxtasksperchild=1) as p:
+        results = list(p.imap_unordered(safe_sim, sim_args, chunksize=1))
 
-    return 0
+    return 1 if any(r == -1 for r in results) else 0
 
 
 def _welcome_to_hive():
@@ -2,7 +2,19 @@ from __future__ import annotations
 
 import functools as ft
 import logging
-from typing import Dict, Tuple, Callable, NamedTuple, Optional, TYPE_CHECKING
+from math import ceil
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Tuple,
+    Callable,
+    NamedTuple,
+    Optional,
+    Set,
+    TYPE_CHECKING,
+)
 
 import h3
 import numpy as np
@@ -23,9 +35,11 @@ from nrel.hive.util.h3_ops import H3Ops
 from nrel.hive.util.tuple_ops import TupleOps
 
 if TYPE_CHECKING:
-    from nrel.hive.util.units import Ratio, Seconds
+    import immutables
+
+    from nrel.hive.util.units import Kilometers, Ratio, Seconds
     from nrel.hive.util.typealiases import *
-    from nrel.hive.model.entity import EntityABC
+    from nrel.hive.model.entity import Entity, EntityABC
 
 
 log = logging.getLogger(__name__)
@@ -42,17 +56,12 @@ class AssignmentSolution(NamedTuple):
     solution: Tuple[Tuple[EntityId, EntityId], ...] = ()
     solution_cost: float = 0.0
 
-    def add(self, pair: Tuple[EntityId, EntityId], cost: float) -> AssignmentSolution:
-        return self._replace(
-            solution=(pair,) + self.solution,
-            solution_cost=self.solution_cost + cost,
-        )
-
 
 def find_assignment(
     assignees: Tuple[EntityABC, ...],
     targets: Tuple[EntityABC, ...],
     cost_fn: Callable[[EntityABC, EntityABC], float],
+    candidates: Optional[Iterable[Tuple[int, int]]] = None,
 ) -> AssignmentSolution:
     """
 
@@ -60,6 +69,8 @@ def find_assignment(
     :param assignees: entities we are assigning to. assumed to have an id field.
     :param targets: the different entities that each assignee can be assigned to. assumed to have an id field.
     :param cost_fn: computes the cost of choosing a specific assignee (slot 1) with a specific target (slot 2)
+    :param candidates: optional (assignee index, target index) pairs to evaluate. any pair not listed here
+                       is treated as infeasible and will not be part of the solution. if None, all pairs are evaluated.
     :return: a collection of pairs of (AssigneeId, TargetId) indicating the solution, along with it's cost
     """
 
@@ -69,31 +80,111 @@ def find_assignment(
         initial_cost = float("inf")
         table = np.full((len(assignees), len(targets)), initial_cost)
 
-        # evaluate the cost of all possible assignments between each assignee/target pair
-        upper_bound = float("-inf")
-        for i in range(len(assignees)):
-            for j in range(len(targets)):
-                cost = cost_fn(assignees[i], targets[j])
-                upper_bound = cost if cost > upper_bound and cost != float("inf") else upper_bound
-                table[i][j] = cost
+        if candidates is None:
+            candidates = ((i, j) for i in range(len(assignees)) for j in range(len(targets)))
+
+        # evaluate the cost of the candidate assignments between assignee/target pairs
+        for i, j in candidates:
+            table[i, j] = cost_fn(assignees[i], targets[j])
 
-        # linear_sum_assignment borks with infinite values; this 2nd step replaces
-        # float("inf") values with an upper-bound value which is 1 beyond our highest-observed value
-        upper_bound += 1
-        table[table == float("inf")] = upper_bound
+        feasible = np.isfinite(table)
+        if not feasible.any():
+            return AssignmentSolution()
+
+        # linear_sum_assignment borks with infinite values; this 2nd step replaces float("inf") values
+        # with an upper-bound value that is larger than the cost of any combination of feasible pairs,
+        # so that the solver never trades a feasible pair for an infeasible one
+        upper_bound = np.abs(table[feasible]).sum() + 1
+        table[~feasible] = upper_bound
 
         # apply the Kuhn-Munkres algorithm
         rows, cols = linear_sum_assignment(table)
 
-        # interpret the row/column assignments back to EntityIds and compute the total cost of this assignment
-        def _add_to_solution(assignment_solution: AssignmentSolution, i: int) -> AssignmentSolution:
-            this_pair = (assignees[rows[i]].id, targets[cols[i]].id)
-            this_cost = table[rows[i]][cols[i]]
-            return assignment_solution.add(this_pair, this_cost)
-
-        solution = ft.reduce(_add_to_solution, range(len(rows)), AssignmentSolution())
+        # interpret the row/column assignments back to EntityIds and compute the total cost of this assignment,
+        # dropping any pairs that were only matched by way of an infeasible entry.
+        # pairs are collected in a list and frozen once to avoid re-copying the solution tuple per pair
+        pairs: List[Tuple[EntityId, EntityId]] = []
+        solution_cost = 0.0
+        for i, j in zip(rows, cols):
+            if feasible[i, j]:
+                pairs.append((assignees[i].id, targets[j].id))
+                solution_cost += table[i, j]
+
+        return AssignmentSolution(solution=tuple(pairs), solution_cost=solution_cost)
+
+
+def h3_search_candidates(
+    assignees: Tuple[Entity, ...],
+    targets: Tuple[Entity, ...],
+    assignee_search: immutables.Map[GeoId, FrozenSet[EntityId]],
+    target_search: immutables.Map[GeoId, FrozenSet[EntityId]],
+    sim_h3_search_resolution: int,
+    max_search_distance_km: Kilometers,
+) -> Tuple[Tuple[int, int], ...]:
+    """
+    finds the (assignee index, target index) pairs that are near enough to each other to be
+    considered by find_assignment. entities are bucketed by the search collections already
+    stored on the SimulationState, so no search cell is recomputed per entity, and each target
+    cell only inspects the occupied assignee cells within k grid steps of it.
+
+
+    :param assignees: entities we are assigning to, expected to have a geoid
+    :param targets: entities that we are assigning, expected to have a geoid
+    :param assignee_search: the search collection holding the assignees, such as SimulationState.v_search
+    :param target_search: the search collection holding the targets, such as SimulationState.r_search
+    :param sim_h3_search_resolution: the h3 resolution of the search collections
+    :param max_search_distance_km: the maximum distance an assignee can be from a target
+    :return: the candidate index pairs
+    """
+    k_dist_km = h3.edge_length(sim_h3_search_resolution, unit="km") * 2  # kilometers
+    max_k = ceil(max_search_distance_km / k_dist_km)
+
+    def _by_cell(
+        entities: Tuple[Entity, ...],
+        search: immutables.Map[GeoId, FrozenSet[EntityId]],
+    ) -> Dict[GeoId, List[int]]:
+        index = {e.id: idx for idx, e in enumerate(entities)}
+        by_cell: Dict[GeoId, List[int]] = {}
+        for cell, ids in search.items():
+            idxs = [index[entity_id] for entity_id in ids if entity_id in index]
+            if idxs:
+                by_cell[cell] = idxs
+        return by_cell
+
+    assignees_by_cell = _by_cell(assignees, assignee_search)
+    targets_by_cell = _by_cell(targets, target_search)
+
+    rings: Dict[GeoId, Set[GeoId]] = {}
+
+    def _within_k(origin: GeoId, cell: GeoId) -> bool:
+        try:
+            return h3.h3_distance(origin, cell) <= max_k
+        except ValueError:
+            # grid distance is undefined across some pentagon distortions, even for cells
+            # within max_k, so fall back to membership in the k-ring, built once per origin
+            ring = rings.get(origin)
+            if ring is None:
+                ring = h3.k_ring(origin, max_k)
+                rings[origin] = ring
+            return cell in ring
+
+    # the number of cells in a k-ring, known without building it
+    ring_size = 3 * max_k * (max_k + 1) + 1
+
+    candidates: List[Tuple[int, int]] = []
+    for cell, target_idxs in targets_by_cell.items():
+        # probe whichever side is smaller: the cells of this ring, or the occupied assignee cells,
+        # which are measured against this cell directly so that large rings are never built
+        if ring_size < len(assignees_by_cell):
+            ring = h3.k_ring(cell, max_k)
+            nearby = [i for c in ring for i in assignees_by_cell.get(c, ())]
+        else:
+            nearby = [
+                i for c, idxs in assignees_by_cell.items() if _within_k(cell, c) for i in idxs
+            ]
+        candidates.extend((i, j) for j in target_idxs for i in nearby)
 
-        return solution
+    return tuple(candidates)
 
 
 def h3_distance_cost(a: EntityABC, b: EntityABC) -> float:
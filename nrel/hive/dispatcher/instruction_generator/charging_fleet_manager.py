@@ -5,8 +5,7 @@ from dataclasses import dataclass
 from typing import Tuple, TYPE_CHECKING
 
 from nrel.hive.reporting import instruction_generator_event_ops
-from nrel.hive.state.vehicle_state.idle import Idle
-from nrel.hive.state.vehicle_state.repositioning import Repositioning
+from nrel.hive.state.vehicle_state.vehicle_state_type import VehicleStateType
 
 if TYPE_CHECKING:
     from nrel.hive.model.vehicle.vehicle import Vehicle
@@ -23,6 +22,8 @@ from nrel.hive.dispatcher.instruction_generator.instruction_generator_ops import
 
 log = logging.getLogger(__name__)
 
+CHARGE_CANDIDATE_STATES = frozenset([VehicleStateType.IDLE, VehicleStateType.REPOSITIONING])
+
 
 @dataclass(frozen=True)
 class ChargingFleetManager(InstructionGenerator):
@@ -49,10 +50,7 @@ class ChargingFleetManager(InstructionGenerator):
         # find vehicles that fall below the sum of the threshold distance and nearest valid station distance
 
         def charge_candidate(v: Vehicle) -> bool:
-            proper_state = isinstance(v.vehicle_state, Idle) or isinstance(
-                v.vehicle_state, Repositioning
-            )
-            if not proper_state:
+            if v.vehicle_state.vehicle_state_type not in CHARGE_CANDIDATE_STATES:
                 return False
 
             mechatronics = environment.mechatronics.get(v.mechatronics_id)
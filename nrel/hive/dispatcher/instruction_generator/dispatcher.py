@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import functools as ft
 import logging
 from dataclasses import dataclass
-from typing import Tuple, TYPE_CHECKING, Optional
+from typing import List, Set, Tuple, TYPE_CHECKING, Optional
 
 from nrel.hive.dispatcher.instruction_generator import assignment_ops
-from nrel.hive.state.vehicle_state.charging_base import ChargingBase
+from nrel.hive.state.vehicle_state.vehicle_state_type import VehicleStateType
 
 if TYPE_CHECKING:
     from nrel.hive.state.simulation_state.simulation_state import SimulationState
@@ -15,7 +14,7 @@ if TYPE_CHECKING:
     from nrel.hive.model.vehicle.vehicle import Vehicle
     from nrel.hive.model.request.request import Request
     from nrel.hive.config.dispatcher_config import DispatcherConfig
-    from nrel.hive.util.typealiases import MembershipId
+    from nrel.hive.util.typealiases import MembershipId, RequestId, VehicleId
 
 from nrel.hive.dispatcher.instruction_generator.instruction_generator import InstructionGenerator
 from nrel.hive.dispatcher.instruction.instructions import DispatchTripInstruction
@@ -43,46 +42,61 @@ class Dispatcher(InstructionGenerator):
         :param simulation_state: The current simulation state
         :return: the updated Dispatcher along with instructions
         """
-        base_charging_range_km_threshold = (
-            environment.config.dispatcher.base_charging_range_km_threshold
+        dispatcher_config = environment.config.dispatcher
+        # resolve the configured state names once so vehicles are filtered by state type
+        valid_dispatch_state_types = frozenset(
+            VehicleStateType.from_string(s) for s in dispatcher_config.valid_dispatch_states
         )
+        base_charging_range_km_threshold = dispatcher_config.base_charging_range_km_threshold
+        matching_range_km_threshold = dispatcher_config.matching_range_km_threshold
+
+        def _is_valid_for_dispatch(vehicle: Vehicle) -> bool:
+            vehicle_state = vehicle.vehicle_state
+            if vehicle_state.vehicle_state_type not in valid_dispatch_state_types:
+                return False
+            elif not vehicle.driver_state.available:
+                return False
+
+            mechatronics = environment.mechatronics.get(vehicle.mechatronics_id)
+            if mechatronics is None:
+                log.error(f"mechatonrics not found for vehicle {vehicle.id}")
+                return False
+
+            range_remaining_km = mechatronics.range_remaining_km(vehicle)
+
+            # if we are at a base, do we have enough remaining range to leave the base?
+            if (
+                vehicle_state.vehicle_state_type == VehicleStateType.CHARGING_BASE
+                and range_remaining_km < base_charging_range_km_threshold
+            ):
+                return False
+            # do we have enough remaining range to allow us to match?
+            return range_remaining_km > matching_range_km_threshold
+
+        # the dispatch criteria do not depend on the fleet, so vehicles are only filtered once per
+        # time step; each fleet assignment then only has to check membership
+        dispatchable_vehicles = simulation_state.get_vehicles(
+            filter_function=_is_valid_for_dispatch,
+        )
+
+        # vehicles and requests with more than one membership can show up in multiple fleet
+        # assignments; track the ones already assigned so they are only matched once per time step
+        already_dispatched: Set[VehicleId] = set()
+        already_assigned: Set[RequestId] = set()
 
         def _solve_assignment(
-            inst_acc: Tuple[DispatchTripInstruction, ...],
             membership_id: Optional[MembershipId],
         ) -> Tuple[DispatchTripInstruction, ...]:
-            def _is_valid_for_dispatch(vehicle: Vehicle) -> bool:
-                vehicle_state_str = vehicle.vehicle_state.__class__.__name__.lower()
-                if vehicle_state_str not in environment.config.dispatcher.valid_dispatch_states:
-                    return False
-                elif not vehicle.driver_state.available:
-                    return False
-                elif (
-                    membership_id is not None
-                    and not vehicle.membership.grant_access_to_membership_id(membership_id)
-                ):
-                    return False
-
-                mechatronics = environment.mechatronics.get(vehicle.mechatronics_id)
-                if mechatronics is None:
-                    log.error(f"mechatonrics not found for vehicle {vehicle.id}")
+            def _valid_vehicle(vehicle: Vehicle) -> bool:
+                if vehicle.id in already_dispatched:
                     return False
-
-                range_remaining_km = mechatronics.range_remaining_km(vehicle)
-
-                # if we are at a base, do we have enough remaining range to leave the base?
-                if (
-                    isinstance(vehicle.vehicle_state, ChargingBase)
-                    and range_remaining_km < base_charging_range_km_threshold
-                ):
-                    return False
-                # do we have enough remaining range to allow us to match?
-                return bool(
-                    range_remaining_km > environment.config.dispatcher.matching_range_km_threshold
-                )
+                elif membership_id is None:
+                    return True
+                else:
+                    return vehicle.membership.grant_access_to_membership_id(membership_id)
 
             def _valid_request(r: Request) -> bool:
-                not_already_dispatched = not r.dispatched_vehicle
+                not_already_dispatched = not r.dispatched_vehicle and r.id not in already_assigned
                 valid_access = (
                     r.membership.grant_access_to_membership_id(membership_id)
                     if membership_id is not None
@@ -91,9 +105,10 @@ class Dispatcher(InstructionGenerator):
                 return not_already_dispatched and valid_access
 
             # collect the vehicles and requests for the assignment algorithm
-            available_vehicles = simulation_state.get_vehicles(
-                filter_function=_is_valid_for_dispatch,
-            )
+            available_vehicles = tuple(filter(_valid_vehicle, dispatchable_vehicles))
+            if not available_vehicles:
+                # nothing to assign, skip sorting the requests
+                return ()
 
             unassigned_requests = simulation_state.get_requests(
                 sort=True,
@@ -102,34 +117,40 @@ class Dispatcher(InstructionGenerator):
                 filter_function=_valid_request,
             )
 
+            # only pair vehicles and requests that are within the search radius of each other
+            candidates = assignment_ops.h3_search_candidates(
+                available_vehicles,
+                unassigned_requests,
+                simulation_state.v_search,
+                simulation_state.r_search,
+                simulation_state.sim_h3_search_resolution,
+                environment.config.dispatcher.max_search_radius_km,
+            )
+
             # select assignment of vehicles to requests
             solution = assignment_ops.find_assignment(
                 available_vehicles,
                 unassigned_requests,
                 assignment_ops.h3_distance_cost,
+                candidates,
             )
-            instructions = ft.reduce(
-                lambda acc, pair: (
-                    *acc,
-                    DispatchTripInstruction(pair[0], pair[1]),
-                ),
-                solution.solution,
-                inst_acc,
-            )
+            already_dispatched.update(vehicle_id for vehicle_id, _ in solution.solution)
+            already_assigned.update(request_id for _, request_id in solution.solution)
 
-            return instructions
+            return tuple(
+                DispatchTripInstruction(vehicle_id, request_id)
+                for vehicle_id, request_id in solution.solution
+            )
 
         if len(environment.fleet_ids) > 0:
             fleet_ids = environment.fleet_ids
         else:
             fleet_ids = frozenset([None])
 
-        initial_instructions: Tuple[DispatchTripInstruction, ...] = tuple()
-
-        all_instructions = ft.reduce(
-            _solve_assignment,
-            fleet_ids,
-            initial_instructions,
-        )
+        # a vehicle or request shared by several fleets goes to the first fleet that matches it,
+        # so fleets are visited in a fixed order to keep runs reproducible across hash seeds
+        all_instructions: List[DispatchTripInstruction] = []
+        for fleet_id in sorted(fleet_ids, key=str):
+            all_instructions.extend(_solve_assignment(fleet_id))
 
-        return self, all_instructions
+        return self, tuple(all_instructions)
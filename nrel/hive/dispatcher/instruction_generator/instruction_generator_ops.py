@@ -76,18 +76,14 @@ class InstructionGenerationResult(NamedTuple):
         :param environment: the simulation environment
         :return:
         """
-        new_instructions = ft.reduce(
-            lambda acc, v: (
-                v.driver_state.generate_instruction(
-                    simulation_state,
-                    environment,
-                    self.instruction_stack.get(v.id),
-                ),
+        new_instructions = [
+            v.driver_state.generate_instruction(
+                simulation_state,
+                environment,
+                self.instruction_stack.get(v.id),
             )
-            + acc,
-            simulation_state.vehicles.values(),
-            (),
-        )
+            for v in simulation_state.vehicles.values()
+        ]
 
         updated_instruction_stack = ft.reduce(
             lambda acc, i: DictOps.add_to_stack_dict(acc, i.vehicle_id, i) if i else acc,
@@ -180,7 +176,7 @@ def instruct_vehicles_to_dispatch_to_station(
     :return: instructions for vehicles to charge at stations
     """
 
-    instructions: Tuple[Instruction, ...] = ()
+    instructions: List[Instruction] = []
 
     for veh in vehicles:
         if len(instructions) >= n:
@@ -263,9 +259,9 @@ def instruct_vehicles_to_dispatch_to_station(
                 charger_id=best_charger_id,
             )
 
-            instructions = instructions + (instruction,)
+            instructions.append(instruction)
 
-    return instructions
+    return tuple(instructions)
 
 
 def get_nearest_valid_station_distance(
@@ -1,7 +1,7 @@
 import functools as ft
 import logging
 import random
-from typing import Callable
+from typing import Callable, List
 
 from returns.result import Result, Failure, Success
 
@@ -51,6 +51,8 @@ def sample_vehicles(
     if not mechatronics:
         return Failure(KeyError(f"mechatronics with id {mechatronics_id} not found"))
     else:
+        # every sampled vehicle starts with empty energy accumulators; the immutable map is shared
+        no_energy = mechatronics.initial_energy(0)
 
         def _add_sample(i: int):
             """
@@ -75,8 +77,6 @@ def sample_vehicles(
                     vehicle_id = f"v{i}"
                     initial_soc = soc_sampling_function()
                     energy = mechatronics.initial_energy(initial_soc)
-                    energy_expended = mechatronics.initial_energy(0)
-                    energy_gained = mechatronics.initial_energy(0)
                     link = location_sampling_function(s)
                     position = EntityPosition(link.link_id, link.start)
                     vehicle_state = Idle.build(vehicle_id)
@@ -85,8 +85,8 @@ def sample_vehicles(
                         id=vehicle_id,
                         mechatronics_id=mechatronics_id,
                         energy=energy,
-                        energy_expended=energy_expended,
-                        energy_gained=energy_gained,
+                        energy_expended=no_energy,
+                        energy_gained=no_energy,
                         position=position,
                         vehicle_state=vehicle_state,
                         driver_state=driver_state,
@@ -126,7 +126,12 @@ def build_default_location_sampling_fn(seed: int = 0) -> Callable[[SimulationSta
     """
     random.seed(seed)
 
+    # the link table is copied into a list once per road network rather than once per sampled vehicle
+    sampled_link_helper = None
+    links: List[Link] = []
+
     def _inner(sim: SimulationState) -> Link:
+        nonlocal sampled_link_helper, links
         if not isinstance(sim.road_network, OSMRoadNetwork):
             raise NotImplementedError(
                 f"this sampling function is only implemented for the OSMRoadNetwork"
@@ -135,7 +140,9 @@ def build_default_location_sampling_fn(seed: int = 0) -> Callable[[SimulationSta
         if sim.road_network.link_helper is None:
             raise Exception("Expected link helper on OSMRoadNetwork but found None")
 
-        links = list(sim.road_network.link_helper.links.values())
+        if sim.road_network.link_helper is not sampled_link_helper:
+            sampled_link_helper = sim.road_network.link_helper
+            links = list(sampled_link_helper.links.values())
         if len(links) == 0:
             raise AssertionError(f"must have at least one link to sample from")
         random_link = random.choice(links)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import functools as ft
-from typing import Union, TYPE_CHECKING
+from typing import List, Union, TYPE_CHECKING
 
 import immutables
 from networkx.classes.reportviews import NodeView
@@ -52,34 +51,20 @@ def route_from_nx_path(
         # with an empty route.
         return None, ()
     else:
-
-        def _accumulate_links(
-            acc: Tuple[Optional[Exception], Optional[Tuple[LinkTraversal, ...]]],
-            node_id_pair: Tuple[int, int],
-        ) -> Tuple[Optional[Exception], Optional[Tuple[LinkTraversal, ...]]]:
-            err, prev_links = acc
-            if err:
-                return acc
-            elif prev_links is None:
-                return acc
-            else:
-                # build a LinkId from the node pair, then look up the associated Link and return it
-                src, dst = node_id_pair
-                link_id = create_link_id(src, dst)
-                link = link_lookup.get(link_id)
-                if not link:
-                    link_err = Exception(
-                        f"networkx shortest path traverses link id {link_id} which does not exist"
-                    )
-                    return link_err, None
-                else:
-                    updated_links = prev_links + (link.to_link_traversal(),)
-                    return None, updated_links
-
-        nx_path_adj_pairs = [(nx_path[i], nx_path[i + 1]) for i in range(0, len(nx_path) - 1)]
-        initial: Tuple[Optional[Exception], Optional[Tuple[LinkTraversal, ...]]] = (None, ())
-        result = ft.reduce(_accumulate_links, nx_path_adj_pairs, initial)
-        return result
+        # walk the adjacent node pairs once, building the route in a list instead of
+        # re-copying a growing tuple for every link
+        links: List[LinkTraversal] = []
+        for i in range(1, len(nx_path)):
+            # build a LinkId from the node pair, then look up the associated Link
+            link_id = create_link_id(nx_path[i - 1], nx_path[i])
+            link = link_lookup.get(link_id)
+            if not link:
+                link_err = Exception(
+                    f"networkx shortest path traverses link id {link_id} which does not exist"
+                )
+                return link_err, None
+            links.append(link.to_link_traversal())
+        return None, tuple(links)
 
 
 def resolve_route_src_dst_positions(
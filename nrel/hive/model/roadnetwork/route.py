@@ -1,5 +1,5 @@
 import functools as ft
-from typing import Any, Tuple, Optional
+from typing import Tuple, Optional
 
 import h3
 
@@ -88,11 +88,8 @@ def to_linestring(route: Route, env: Environment) -> str:
         linestring = wkt.linestring_2d((src, dst), env.config.global_config.wkt_x_y_ordering)
         return linestring
     else:
-        inital: Tuple[Any, ...] = ()
-        points = ft.reduce(
-            lambda acc, l: acc + (h3.h3_to_geo(l.start), h3.h3_to_geo(l.end)),
-            route,
-            inital,
+        points = tuple(
+            point for l in route for point in (h3.h3_to_geo(l.start), h3.h3_to_geo(l.end))
         )
         linestring = wkt.linestring_2d(points, env.config.global_config.wkt_x_y_ordering)
         return linestring
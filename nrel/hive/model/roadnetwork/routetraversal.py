@@ -1,12 +1,8 @@
 from __future__ import annotations
 
-import functools as ft
-from typing import Optional, NamedTuple
+from typing import List, Optional, NamedTuple
 
-from nrel.hive.model.roadnetwork.linktraversal import (
-    LinkTraversalResult,
-    LinkTraversal,
-)
+from nrel.hive.model.roadnetwork.linktraversal import LinkTraversal
 from nrel.hive.model.roadnetwork.linktraversal import traverse_up_to
 from nrel.hive.model.roadnetwork.route import Route
 from nrel.hive.util import TupleOps
@@ -45,43 +41,6 @@ class RouteTraversal(NamedTuple):
         """
         return self.remaining_time_seconds == 0.0
 
-    def add_traversal(self, t: LinkTraversalResult) -> RouteTraversal:
-        """
-        take the result of a link traversal and update the route traversal
-
-
-        :param t: a link traversal
-        :return: the updated route traversal
-        """
-        updated_experienced_route = (
-            self.experienced_route
-            if t.traversed is None
-            else self.experienced_route + (t.traversed,)
-        )
-        updated_remaining_route = (
-            self.remaining_route if t.remaining is None else self.remaining_route + (t.remaining,)
-        )
-        if t.traversed:
-            traversal_distance = self.traversal_distance_km + t.traversed.distance_km
-        else:
-            traversal_distance = self.traversal_distance_km
-        return self._replace(
-            remaining_time_seconds=t.remaining_time_seconds,
-            traversal_distance_km=traversal_distance,
-            experienced_route=updated_experienced_route,
-            remaining_route=updated_remaining_route,
-        )
-
-    def add_link_not_traversed(self, link: LinkTraversal) -> RouteTraversal:
-        """
-        if a link wasn't traversed, be sure to add it to the remaining route
-
-
-        :param link: a link traversal for the remaining route
-        :return: the updated RouteTraversal
-        """
-        return self._replace(remaining_route=self.remaining_route + (link,))
-
 
 def traverse(
     route_estimate: Route, duration_seconds: Seconds
@@ -102,39 +61,39 @@ def traverse(
         return None, RouteTraversal()
     elif TupleOps.head(route_estimate).start == TupleOps.last(route_estimate).end:
         return None, RouteTraversal()
-    else:
-        # function that steps through the route
-        def _traverse(
-            acc: Tuple[Optional[Exception], Optional[RouteTraversal]],
-            link: LinkTraversal,
-        ) -> Tuple[Optional[Exception], Optional[RouteTraversal]]:
-            acc_failures, acc_traversal = acc
-            if acc_failures:
-                return acc
-            elif acc_traversal is None:
-                return acc
-
-            if acc_traversal.no_time_left():
-                return acc_failures, acc_traversal.add_link_not_traversed(link)
-            # traverse this link as far as we can go
-            error, traverse_result = traverse_up_to(link, acc_traversal.remaining_time_seconds)
-            if error:
-                response = Exception(f"failure during traverse")
-                response.__cause__ = error
-                return response, None
-            elif traverse_result is None:
-                response = Exception(f"failure during traverse")
-                return response, None
-            else:
-                updated_experienced_route = acc_traversal.add_traversal(traverse_result)
-                return acc_failures, updated_experienced_route
-
-        # initial search state has a route traversal and an Optional[Exception]
-        initial: Tuple[Optional[Exception], Optional[RouteTraversal]] = (
-            None,
-            RouteTraversal(remaining_time_seconds=duration_seconds),
-        )
-
-        result = ft.reduce(_traverse, route_estimate, initial)
-
-        return result
+
+    experienced_route: List[LinkTraversal] = []
+    remaining_route: Route = ()
+    remaining_time_seconds = duration_seconds
+    traversal_distance_km: Kilometers = 0
+
+    # step through the route by index so that, once we run out of time, the rest of the
+    # route can be kept as a single slice instead of being copied one link at a time
+    for idx, link in enumerate(route_estimate):
+        if remaining_time_seconds == 0.0:
+            remaining_route = remaining_route + tuple(route_estimate[idx:])
+            break
+
+        # traverse this link as far as we can go
+        error, traverse_result = traverse_up_to(link, remaining_time_seconds)
+        if error:
+            response = Exception(f"failure during traverse")
+            response.__cause__ = error
+            return response, None
+        elif traverse_result is None:
+            return Exception(f"failure during traverse"), None
+
+        if traverse_result.traversed is not None:
+            experienced_route.append(traverse_result.traversed)
+            traversal_distance_km += traverse_result.traversed.distance_km
+        if traverse_result.remaining is not None:
+            remaining_route = (traverse_result.remaining,)
+        remaining_time_seconds = traverse_result.remaining_time_seconds
+
+    result = RouteTraversal(
+        remaining_time_seconds=remaining_time_seconds,
+        traversal_distance_km=traversal_distance_km,
+        experienced_route=tuple(experienced_route),
+        remaining_route=remaining_route,
+    )
+    return None, result
@@ -170,12 +170,9 @@ class BEV(MechatronicsInterface):
         )
         vehicle_energy_kwh = vehicle.energy[EnergyType.ELECTRIC]
         new_energy_kwh = max(0.0, vehicle_energy_kwh - energy_used_kwh)
-        updated_vehicle = vehicle.modify_energy(
+        updated_vehicle = vehicle.expend_energy(
             immutables.Map({EnergyType.ELECTRIC: new_energy_kwh})
         )
-        updated_vehicle = updated_vehicle.tick_energy_expended(
-            immutables.Map({EnergyType.ELECTRIC: vehicle_energy_kwh - new_energy_kwh})
-        )
         return updated_vehicle
 
     def idle(self, vehicle: Vehicle, time_seconds: Seconds) -> Vehicle:
@@ -191,12 +188,9 @@ class BEV(MechatronicsInterface):
         idle_energy_kwh = self.idle_kwh_per_hour * time_seconds * SECONDS_TO_HOURS
         vehicle_energy_kwh = vehicle.energy[EnergyType.ELECTRIC]
         new_energy_kwh = max(0.0, vehicle_energy_kwh - idle_energy_kwh)
-        updated_vehicle = vehicle.modify_energy(
+        updated_vehicle = vehicle.expend_energy(
             immutables.Map({EnergyType.ELECTRIC: new_energy_kwh})
         )
-        updated_vehicle = updated_vehicle.tick_energy_expended(
-            immutables.Map({EnergyType.ELECTRIC: vehicle_energy_kwh - new_energy_kwh})
-        )
 
         return updated_vehicle
 
@@ -237,11 +231,6 @@ class BEV(MechatronicsInterface):
             )
             new_energy_kwh = min(self.battery_capacity_kwh, charger_energy_kwh)
 
-        updated_vehicle = vehicle.modify_energy(
-            immutables.Map({EnergyType.ELECTRIC: new_energy_kwh})
-        )
-        updated_vehicle = updated_vehicle.tick_energy_gained(
-            immutables.Map({EnergyType.ELECTRIC: new_energy_kwh - start_energy_kwh})
-        )
+        updated_vehicle = vehicle.gain_energy(immutables.Map({EnergyType.ELECTRIC: new_energy_kwh}))
 
         return updated_vehicle, time_charging_seconds
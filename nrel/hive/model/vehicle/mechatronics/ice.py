@@ -147,12 +147,9 @@ class ICE(MechatronicsInterface):
 
         vehicle_energy_gal_gas = vehicle.energy[EnergyType.GASOLINE]
         new_energy_gal_gas = max(0.0, vehicle_energy_gal_gas - energy_used_gal_gas)
-        updated_vehicle = vehicle.modify_energy(
+        updated_vehicle = vehicle.expend_energy(
             immutables.Map({EnergyType.GASOLINE: new_energy_gal_gas})
         )
-        updated_vehicle = vehicle.tick_energy_expended(
-            immutables.Map({EnergyType.GASOLINE: vehicle_energy_gal_gas - new_energy_gal_gas})
-        )
         return updated_vehicle
 
     def idle(self, vehicle: Vehicle, time_seconds: Seconds) -> Vehicle:
@@ -168,12 +165,9 @@ class ICE(MechatronicsInterface):
         idle_energy_gal_gas = self.idle_gallons_per_hour * time_seconds * SECONDS_TO_HOURS
         vehicle_energy_gal_gas = vehicle.energy[EnergyType.GASOLINE]
         new_energy_gal_gas = max(0.0, vehicle_energy_gal_gas - idle_energy_gal_gas)
-        updated_vehicle = vehicle.modify_energy(
+        updated_vehicle = vehicle.expend_energy(
             immutables.Map({EnergyType.GASOLINE: new_energy_gal_gas})
         )
-        updated_vehicle = vehicle.tick_energy_expended(
-            immutables.Map({EnergyType.GASOLINE: vehicle_energy_gal_gas - new_energy_gal_gas})
-        )
 
         return updated_vehicle
 
@@ -201,9 +195,6 @@ class ICE(MechatronicsInterface):
         pump_gal_gas = start_gal_gas + charger.rate * time_seconds
         new_gal_gas = min(self.tank_capacity_gallons, pump_gal_gas)
 
-        updated_vehicle = vehicle.modify_energy(immutables.Map({EnergyType.GASOLINE: new_gal_gas}))
-        updated_vehicle = updated_vehicle.tick_energy_gained(
-            immutables.Map({EnergyType.GASOLINE: new_gal_gas - start_gal_gas})
-        )
+        updated_vehicle = vehicle.gain_energy(immutables.Map({EnergyType.GASOLINE: new_gal_gas}))
 
         return updated_vehicle, time_seconds
@@ -1,9 +1,8 @@
 from pathlib import Path
 
-import yaml
-
 from nrel.hive.model.vehicle.mechatronics.powercurve.powercurve import Powercurve
 from nrel.hive.model.vehicle.mechatronics.powercurve.tabular_powercurve import TabularPowercurve
+from nrel.hive.util.fs import load_yaml_file
 
 powercurve_models = {"tabular": TabularPowercurve}
 
@@ -16,18 +15,17 @@ def build_powercurve(config: dict) -> Powercurve:
     if not Path(file).is_file():
         raise FileNotFoundError(file)
 
-    with Path(config["powercurve_file"]).open() as f:
-        powercurve_file_contents = yaml.safe_load(f)
-        powercurve_type = powercurve_file_contents.get("type")
+    powercurve_file_contents = load_yaml_file(file)
+    powercurve_type = powercurve_file_contents.get("type")
 
-        # pass config from caller merged with the file contents
-        config.update(powercurve_file_contents)
+    # pass config from caller merged with the file contents
+    config.update(powercurve_file_contents)
 
-        if not powercurve_type:
-            raise KeyError(f"powertrain file {file} missing required 'type' field")
-        if powercurve_type not in powercurve_models:
-            raise IOError(
-                f"PowerCurve with type {powercurve_type} is not recognized, must be one of {powercurve_models.keys()}"
-            )
-        else:
-            return powercurve_models[powercurve_type](data=config)
+    if not powercurve_type:
+        raise KeyError(f"powertrain file {file} missing required 'type' field")
+    if powercurve_type not in powercurve_models:
+        raise IOError(
+            f"PowerCurve with type {powercurve_type} is not recognized, must be one of {powercurve_models.keys()}"
+        )
+    else:
+        return powercurve_models[powercurve_type](data=config)
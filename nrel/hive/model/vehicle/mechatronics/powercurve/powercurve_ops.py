@@ -33,7 +33,8 @@ def time_to_full(
     #some max charge time argument. that at least can be set to
     #int((sim.end_time - sim.sim_time) / sim.timestep_duration_seconds) .
     """
-    if charger.energy_type not in vehicle.energy:
+    energy_type = charger.energy_type
+    if energy_type not in vehicle.energy:
         raise Exception(
             f"Charger energy type is not in vehicle.energy,\n"
             "needed for is_full calculation {charger.energy_type} {vehicle.energy}"
@@ -41,15 +42,13 @@ def time_to_full(
     time_charged = 0
     delta = 1.0
     iter = 0
-    while mechatronics.fuel_source_soc(vehicle) <= target_soc and max_iterations > iter:
+    # the soc is computed once per iteration and shared by the loop condition and the break test
+    soc = mechatronics.fuel_source_soc(vehicle)
+    while soc <= target_soc and max_iterations > iter:
         iter += 1
-        prev_energy = vehicle.energy.get(charger.energy_type)
+        prev_energy = vehicle.energy[energy_type]
 
-        if (
-            min_delta_energy_change > delta
-            and target_soc == 1
-            and mechatronics.fuel_source_soc(vehicle) >= 0.99999
-        ):
+        if min_delta_energy_change > delta and target_soc == 1 and soc >= 0.99999:
             # break if extremely close to 100% charged and delta changing very slowly
             # for the example of a 5000 kW battery this value is 4999.9
             return time_charged
@@ -59,10 +58,10 @@ def time_to_full(
         )
         if prev_energy != 0:
             # calculate delta, if prev_energy is 0 this calculation will break
-            cur_energy = vehicle.energy.get(charger.energy_type)
-            if prev_energy is not None and cur_energy is not None:
-                delta = abs(prev_energy - cur_energy) / prev_energy
+            cur_energy = vehicle.energy[energy_type]
+            delta = abs(prev_energy - cur_energy) / prev_energy
 
         time_charged += time_delta
+        soc = mechatronics.fuel_source_soc(vehicle)
 
     return time_charged
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, Dict, Tuple, Any
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Optional, Dict, Tuple, Any, Sequence
 
 import numpy as np
 
@@ -67,6 +68,11 @@ class TabularPowercurve(Powercurve):
             np.array(list(map(lambda x: x["power_kw"], charging_model))) * nominal_max_charge_kw
         )
 
+        # the charge loop interpolates one point at a time, which is faster over plain floats
+        # than through a numpy call per step
+        self._charging_energy_kwh_values = tuple(self._charging_energy_kwh.tolist())
+        self._charging_rate_kw_values = tuple(self._charging_rate_kw.tolist())
+
     def charge(
         self,
         start_soc: Ratio,
@@ -87,15 +93,36 @@ class TabularPowercurve(Powercurve):
         # iterate for as many seconds in a time step, by step_size_seconds
         t = 0
         energy_kwh = start_soc
+        step_size_hours = self.step_size_seconds * SECONDS_TO_HOURS
         while t < duration_seconds and energy_kwh < full_soc:
-            veh_kw_rate = float(
-                np.interp(energy_kwh, self._charging_energy_kwh, self._charging_rate_kw)
+            veh_kw_rate = _interp(
+                energy_kwh, self._charging_energy_kwh_values, self._charging_rate_kw_values
             )  # kilowatt
             charge_power_kw = min(veh_kw_rate, power_kw)  # kilowatt
-            kwh = charge_power_kw * (self.step_size_seconds * SECONDS_TO_HOURS)  # kilowatt-hours
+            kwh = charge_power_kw * step_size_hours  # kilowatt-hours
 
             energy_kwh += kwh
 
             t += self.step_size_seconds
 
         return energy_kwh, t
+
+
+def _interp(x: float, xp: Sequence[float], fp: Sequence[float]) -> float:
+    """
+    one-dimensional linear interpolation of a single point, matching numpy.interp: values
+    outside of the range of xp take the value of the nearest endpoint
+
+    :param x: the point to interpolate
+    :param xp: the increasing x-coordinates of the data points
+    :param fp: the y-coordinates of the data points
+    :return: the interpolated value
+    """
+    if x <= xp[0]:
+        return fp[0]
+    elif x >= xp[-1]:
+        return fp[-1]
+
+    i = bisect_right(xp, x)
+    slope = (fp[i] - fp[i - 1]) / (xp[i] - xp[i - 1])
+    return slope * (x - xp[i - 1]) + fp[i - 1]
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any
 
 import numpy as np
@@ -22,6 +22,22 @@ class TabularPowertrain(Powertrain):
     consumption_speed: np.ndarray
     consumption_energy_per_distance: np.ndarray
 
+    # conversions from the road network's kmph and kilometers into the units of this powertrain,
+    # resolved once here instead of on every link
+    _speed_conversion: float = field(init=False, repr=False, compare=False)
+    _distance_conversion: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # the lookup tables are shared by every vehicle of this mechatronics type; store them as
+        # contiguous float arrays so np.interp does not convert them again on each call
+        for name in ("consumption_speed", "consumption_energy_per_distance"):
+            table = np.ascontiguousarray(getattr(self, name), dtype=np.float64)
+            object.__setattr__(self, name, table)
+        speed_conversion = get_unit_conversion(Unit.KMPH, self.speed_units)
+        distance_conversion = get_unit_conversion(Unit.KILOMETERS, self.distance_units)
+        object.__setattr__(self, "_speed_conversion", speed_conversion)
+        object.__setattr__(self, "_distance_conversion", distance_conversion)
+
     @classmethod
     def from_data(
         self,
@@ -76,7 +92,7 @@ class TabularPowertrain(Powertrain):
         :return: energy in units captured by self.energy_units
         """
         # convert kilometers per hour to whatever units are used by this powertrain
-        link_speed = link.speed_kmph * get_unit_conversion(Unit.KMPH, self.speed_units)
+        link_speed = link.speed_kmph * self._speed_conversion
 
         energy_per_distance = float(
             np.interp(
@@ -86,9 +102,36 @@ class TabularPowertrain(Powertrain):
             )
         )
         # link distance is in kilometers
-        link_distance = link.distance_km * get_unit_conversion(Unit.KILOMETERS, self.distance_units)
+        link_distance = link.distance_km * self._distance_conversion
         energy = energy_per_distance * link_distance
         return energy
 
     def energy_cost(self, route: Route) -> float:
-        return sum([self.link_cost(link) for link in route])
+        """
+        calculates energy over a route. all links are interpolated in a single vectorized
+        lookup rather than once per link.
+
+
+        :param route: the route to calculate energy over.
+        :return: energy in units captured by self.energy_units
+        """
+        if len(route) == 0:
+            return 0.0
+        elif len(route) == 1:
+            # not worth building arrays for the single link traversed in most time steps
+            return self.link_cost(route[0])
+
+        link_speeds = np.fromiter((link.speed_kmph for link in route), float, len(route))
+        link_distances = np.fromiter((link.distance_km for link in route), float, len(route))
+
+        # convert kilometers per hour to whatever units are used by this powertrain
+        link_speeds *= self._speed_conversion
+        # link distance is in kilometers
+        link_distances *= self._distance_conversion
+
+        energy_per_distance = np.interp(
+            link_speeds,
+            self.consumption_speed,
+            self.consumption_energy_per_distance,
+        )
+        return float(np.dot(energy_per_distance, link_distances))
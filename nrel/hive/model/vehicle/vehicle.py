@@ -89,6 +89,8 @@ class Vehicle(Entity):
             raise IOError("cannot load a vehicle without a 'lon'")
         elif "mechatronics_id" not in row:
             raise IOError("cannot load a vehicle without a 'mechatronics_id'")
+        elif "initial_soc" not in row:
+            raise IOError("cannot load a vehicle without an 'initial_soc'")
         else:
             try:
                 vehicle_id = row["vehicle_id"]
@@ -103,14 +105,14 @@ class Vehicle(Entity):
                         f"was not able to find mechatronics '{mechatronics_id}' for vehicle {vehicle_id} in environment: found {found}"
                     )
                 energy = mechatronics.initial_energy(float(row["initial_soc"]))
-                energy_expended = mechatronics.initial_energy(0.0)
-                energy_gained = mechatronics.initial_energy(0.0)
+                # both accumulators start empty; the immutable map can be shared
+                no_energy = mechatronics.initial_energy(0.0)
 
                 schedule_id = row.get(
                     "schedule_id"
                 )  # if None, it signals an autonomous vehicle, otherwise, human with schedule
                 home_base_id = row.get("home_base_id")
-                if schedule_id and not schedule_id in environment.schedules.keys():
+                if schedule_id and schedule_id not in environment.schedules:
                     raise IOError(
                         f"was not able to find schedule '{schedule_id}' in environment for vehicle {vehicle_id}"
                     )
@@ -134,8 +136,8 @@ class Vehicle(Entity):
                     id=vehicle_id,
                     mechatronics_id=mechatronics_id,
                     energy=energy,
-                    energy_expended=energy_expended,
-                    energy_gained=energy_gained,
+                    energy_expended=no_energy,
+                    energy_gained=no_energy,
                     membership=Membership(),
                     position=start_position,
                     vehicle_state=Idle.build(vehicle_id),
@@ -150,14 +152,31 @@ class Vehicle(Entity):
     def __repr__(self) -> str:
         return f"Vehicle({self.id},{self.vehicle_state})"
 
-    def modify_energy(self, energy: immutables.Map[EnergyType, float]) -> Vehicle:
+    def expend_energy(self, energy: immutables.Map[EnergyType, float]) -> Vehicle:
         """
-        modify the energy level of the vehicle. should only be used by the mechatronics ops
+        modify the energy level of the vehicle after consuming energy, and add the energy used
+        to the energy expended, in a single update. should only be used by the mechatronics ops
 
-        :param energy:
-        :return:
+        :param energy: the energy remaining after consumption
+        :return: the updated Vehicle
         """
-        return replace(self, energy=energy)
+        energy_expended = {
+            k: self.energy_expended[k] + (self.energy[k] - energy[k]) for k in self.energy.keys()
+        }
+        return replace(self, energy=energy, energy_expended=immutables.Map(energy_expended))
+
+    def gain_energy(self, energy: immutables.Map[EnergyType, float]) -> Vehicle:
+        """
+        modify the energy level of the vehicle after adding energy, and add the energy added
+        to the energy gained, in a single update. should only be used by the mechatronics ops
+
+        :param energy: the energy after adding energy
+        :return: the updated Vehicle
+        """
+        energy_gained = {
+            k: self.energy_gained[k] + (energy[k] - self.energy[k]) for k in self.energy.keys()
+        }
+        return replace(self, energy=energy, energy_gained=immutables.Map(energy_gained))
 
     def modify_vehicle_state(self, vehicle_state: VehicleState) -> Vehicle:
         """
@@ -213,26 +232,6 @@ class Vehicle(Entity):
         """
         return replace(self, distance_traveled_km=self.distance_traveled_km + delta_d_km)
 
-    def tick_energy_expended(self, delta_energy: immutables.Map[EnergyType, float]) -> Vehicle:
-        """
-        adds energy expenditure to vehicle
-
-        :param delta_energy:
-        :return:
-        """
-        energy_expended = {k: self.energy_expended[k] + delta_energy[k] for k in self.energy.keys()}
-        return replace(self, energy_expended=immutables.Map(energy_expended))
-
-    def tick_energy_gained(self, delta_energy: immutables.Map[EnergyType, float]) -> Vehicle:
-        """
-        adds energy gain to vehicle
-
-        :param delta_energy:
-        :return:
-        """
-        energy_gained = {k: self.energy_gained[k] + delta_energy[k] for k in self.energy.keys()}
-        return replace(self, energy_gained=immutables.Map(energy_gained))
-
     def set_membership(self, member_ids: Tuple[str, ...]) -> Vehicle:
         """
         sets the membership(s) of the vehicle
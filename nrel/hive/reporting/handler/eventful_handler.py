@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, List
 
 from nrel.hive.reporting import vehicle_event_ops
-from nrel.hive.reporting.handler.handler import Handler
+from nrel.hive.reporting.handler.handler import Handler, log_entry
 from nrel.hive.reporting.report_type import ReportType
 
 if TYPE_CHECKING:
@@ -35,6 +34,8 @@ class EventfulHandler(Handler):
             filter(lambda r: r.report_type != ReportType.INSTRUCTION, reports)
         )
 
+        entries = []
+
         # station load events, written with reference to a specific station, take the sum of
         # charge events over a time step associated with a single station
         if ReportType.STATION_LOAD_EVENT in self.global_config.log_sim_config:
@@ -42,14 +43,15 @@ class EventfulHandler(Handler):
                 reports_not_instructions, sim_state
             )
             for report in station_load_reports:
-                entry = json.dumps(report.as_json(), default=str)
-                self.log_file.write(entry + "\n")
+                entries.append(log_entry(report.as_json()))
 
         for report in reports_not_instructions:
             if report.report_type in self.global_config.log_sim_config:
                 report_json = report.as_json()
-                entry = json.dumps(report_json, default=str)
-                self.log_file.write(entry + "\n")
+                entries.append(log_entry(report_json))
+
+        # write all events for this time step at once
+        self.log_file.write("".join(entries))
 
     def close(self, runner_payload: RunnerPayload):
         self.log_file.close()
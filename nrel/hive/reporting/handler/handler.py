@@ -1,12 +1,27 @@
 from __future__ import annotations
 
+import json
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Any, Dict, List
 
 if TYPE_CHECKING:
     from nrel.hive.reporting.reporter import Report
     from nrel.hive.runner.runner_payload import RunnerPayload
 
+# json.dumps builds a new encoder on every call when given options, so log entries share one
+_LOG_ENTRY_ENCODER = json.JSONEncoder(default=str)
+
+
+def log_entry(entry: Dict[str, Any]) -> str:
+    """
+    encodes a report as a single line of a json lines log file.
+    values that are not json serializable are written as strings.
+
+    :param entry: the report contents
+    :return: the json-encoded line, with a trailing newline
+    """
+    return _LOG_ENTRY_ENCODER.encode(entry) + "\n"
+
 
 class Handler(ABC):
     """
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING, List
 
-from nrel.hive.reporting.handler.handler import Handler
+from nrel.hive.reporting.handler.handler import Handler, log_entry
 from nrel.hive.reporting.report_type import ReportType
 
 if TYPE_CHECKING:
@@ -28,14 +27,17 @@ class InstructionHandler(Handler):
         self.global_config = global_config
 
     def handle(self, reports: List[Report], runner_payload: RunnerPayload):
+        if ReportType.INSTRUCTION not in self.global_config.log_sim_config:
+            return
+
+        entries = []
         for report in reports:
-            if (
-                report.report_type == ReportType.INSTRUCTION
-                and ReportType.INSTRUCTION in self.global_config.log_sim_config
-            ):
+            if report.report_type == ReportType.INSTRUCTION:
                 report_json = report.as_json()
-                entry = json.dumps(report_json, default=str)
-                self.log_file.write(entry + "\n")
+                entries.append(log_entry(report_json))
+
+        # write all instructions for this time step at once
+        self.log_file.write("".join(entries))
 
     def close(self, runner_payload: RunnerPayload):
         self.log_file.close()
@@ -62,7 +62,7 @@ class KeplerHandler(Handler):
                     self.log_file.write(",\n")
                 else:
                     self.first_feature = False
-                json.dump(kepler_feature.gen_json(), self.log_file)
+                self.log_file.write(json.dumps(kepler_feature.gen_json()))
                 # clear out the old coordinates and start a new "Feature"
                 kepler_feature.reset(vehicle.vehicle_state.__class__.__name__, sim_state.sim_time)
 
@@ -77,6 +77,6 @@ class KeplerHandler(Handler):
                 self.log_file.write(",\n")
             else:
                 self.first_feature = False
-            json.dump(kepler_feature.gen_json(), self.log_file)
+            self.log_file.write(json.dumps(kepler_feature.gen_json()))
         self.log_file.write(SUFIX)
         self.log_file.close()
@@ -1,12 +1,11 @@
-import json
-from dataclasses import asdict
+from dataclasses import fields
 from pathlib import Path
 from typing import List
 
 from nrel.hive.config.global_config import GlobalConfig
 from nrel.hive.model.station.station import Station
 from nrel.hive.model.vehicle.vehicle import Vehicle
-from nrel.hive.reporting.handler.handler import Handler
+from nrel.hive.reporting.handler.handler import Handler, log_entry
 from nrel.hive.reporting.report_type import ReportType
 from nrel.hive.reporting.reporter import Report
 from nrel.hive.runner import RunnerPayload
@@ -99,10 +98,10 @@ class StatefulHandler(Handler):
 
     @staticmethod
     def station_asdict(station: Station) -> dict:
-        out_dict = asdict(station)
-        del out_dict["id"]
-        del out_dict["state"]
-        del out_dict["energy_dispensed"]
+        # a shallow copy of the remaining fields, dataclasses.asdict would deep copy the charger
+        # states only for them to be removed here
+        skip = ("id", "state", "energy_dispensed")
+        out_dict = {f.name: getattr(station, f.name) for f in fields(station) if f.name not in skip}
 
         out_dict["station_id"] = station.id
         out_dict["memberships"] = str(station.membership)
@@ -121,9 +120,15 @@ class StatefulHandler(Handler):
         return out_dict
 
     def _report_entities(self, entities, asdict, sim_time, report_type):
+        # these fields are shared by every entity in this time step
+        sim_time_str = str(sim_time)
+        report_type_name = report_type.name
+        entries = []
         for e in entities:
             log_dict = asdict(e)
-            log_dict["sim_time"] = str(sim_time)
-            log_dict["report_type"] = report_type.name
-            entry = json.dumps(log_dict, default=str)
-            self.log_file.write(entry + "\n")
+            log_dict["sim_time"] = sim_time_str
+            log_dict["report_type"] = report_type_name
+            entries.append(log_entry(log_dict))
+
+        # write all entities for this time step at once
+        self.log_file.write("".join(entries))
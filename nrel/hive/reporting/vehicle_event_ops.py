@@ -43,20 +43,18 @@ def vehicle_move_event(
     vehicle_memberships = prev_vehicle.membership.to_json()
     delta_distance: float = next_vehicle.distance_traveled_km - prev_vehicle.distance_traveled_km
 
-    if set(prev_vehicle.energy.keys()) != set(next_vehicle.energy.keys()):
+    # compare the energy types by size and membership, the sets are only built for the error message
+    prev_energy, next_energy = prev_vehicle.energy, next_vehicle.energy
+    if len(prev_energy) != len(next_energy) or any(t not in prev_energy for t in next_energy):
         raise ValueError(
-            f"Energy types do not match: {set(prev_vehicle.energy.keys())} != {set(next_vehicle.energy.keys())}"
+            f"Energy types do not match: {set(prev_energy.keys())} != {set(next_energy.keys())}"
         )
-    elif len(next_vehicle.energy.keys()) > 1:
+    elif len(next_energy) > 1:
         raise NotImplementedError("hive doesn't currently support multiple energy types")
-    else:
-        energy_units = list(next_vehicle.energy.keys())[0].units
 
-    delta_energy = ft.reduce(
-        lambda acc, e_type: acc + next_vehicle.energy[e_type] - prev_vehicle.energy[e_type],
-        next_vehicle.energy.keys(),
-        0.0,
-    )
+    (energy_type,) = next_energy.keys()
+    energy_units = energy_type.units
+    delta_energy = next_energy[energy_type] - prev_energy[energy_type]
 
     geoid = next_vehicle.geoid
     lat, lon = h3.h3_to_geo(geoid)
@@ -99,8 +97,7 @@ def vehicle_charge_event(
 
     :return: a charge event report
     """
-    energy_type = next_vehicle.energy.get(charger.energy_type)
-    if not energy_type:
+    if charger.energy_type not in next_vehicle.energy:
         raise ValueError(
             f"Energy type mismatch: vehicle {next_vehicle.id} does not use energy type {charger.energy_type}"
         )
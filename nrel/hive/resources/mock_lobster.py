@@ -1,10 +1,10 @@
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 from typing import Union, Callable
 
 import h3
 import immutables
-import yaml
 from pkg_resources import resource_filename
 
 from nrel.hive.config import HiveConfig
@@ -55,6 +55,7 @@ from nrel.hive.state.simulation_state.simulation_state import SimulationState
 from nrel.hive.state.simulation_state.update.step_simulation import StepSimulation
 from nrel.hive.state.simulation_state.update.update import Update
 from nrel.hive.state.vehicle_state.vehicle_state import VehicleState
+from nrel.hive.util.fs import load_yaml_file
 from nrel.hive.util.typealiases import *
 from nrel.hive.util.units import *
 
@@ -293,10 +294,9 @@ def mock_ev_powertrain(nominal_watt_hour_per_mile) -> TabularPowertrain:
     powertrain_file = resource_filename(
         "nrel.hive.resources.powertrain", "normalized-electric.yaml"
     )
-    with Path(powertrain_file).open() as f:
-        data = yaml.safe_load(f)
-        data["scale_factor"] = nominal_watt_hour_per_mile
-        return TabularPowertrain.from_data(data=data)
+    data = load_yaml_file(powertrain_file)
+    data["scale_factor"] = nominal_watt_hour_per_mile
+    return TabularPowertrain.from_data(data=data)
 
 
 def mock_powercurve(
@@ -304,13 +304,12 @@ def mock_powercurve(
     battery_capacity_kwh=50,
 ) -> TabularPowercurve:
     powercurve_file = resource_filename("nrel.hive.resources.powercurve", "normalized.yaml")
-    with Path(powercurve_file).open() as f:
-        data = yaml.safe_load(f)
-        return TabularPowercurve(
-            data=data,
-            nominal_max_charge_kw=nominal_max_charge_kw,
-            battery_capacity_kwh=battery_capacity_kwh,
-        )
+    data = load_yaml_file(powercurve_file)
+    return TabularPowercurve(
+        data=data,
+        nominal_max_charge_kw=nominal_max_charge_kw,
+        battery_capacity_kwh=battery_capacity_kwh,
+    )
 
 
 def mock_bev(
@@ -335,10 +334,9 @@ def mock_ice_powertrain(nominal_miles_per_gallon) -> TabularPowertrain:
     powertrain_file = resource_filename(
         "nrel.hive.resources.powertrain", "normalized-gasoline.yaml"
     )
-    with Path(powertrain_file).open() as f:
-        data = yaml.safe_load(f)
-        data["scale_factor"] = 1 / nominal_miles_per_gallon
-        return TabularPowertrain.from_data(data=data)
+    data = load_yaml_file(powertrain_file)
+    data["scale_factor"] = 1 / nominal_miles_per_gallon
+    return TabularPowertrain.from_data(data=data)
 
 
 def mock_ice(
@@ -680,6 +678,9 @@ def mock_dcfc_charger_id():
     return "DCFC"
 
 
+# chargers are immutable and shared by reference across stations, like the entries of
+# Environment.chargers, so each mock charger type is built once
+@lru_cache(maxsize=None)
 def mock_l1_charger():
     return Charger(
         mock_l1_charger_id(),
@@ -689,6 +690,7 @@ def mock_l1_charger():
     )
 
 
+@lru_cache(maxsize=None)
 def mock_l2_charger():
     return Charger(
         mock_l2_charger_id(),
@@ -698,6 +700,7 @@ def mock_l2_charger():
     )
 
 
+@lru_cache(maxsize=None)
 def mock_dcfc_charger():
     return Charger(
         mock_dcfc_charger_id(),
@@ -707,6 +710,7 @@ def mock_dcfc_charger():
     )
 
 
+@lru_cache(maxsize=None)
 def mock_gasoline_pump():
     gal_per_minute = 10  # source: https://en.wikipedia.org/wiki/Gasoline_pump
     gal_per_second = gal_per_minute / 60
@@ -3,7 +3,6 @@ from __future__ import annotations
 from typing import (
     NamedTuple,
     Optional,
-    cast,
     Tuple,
     Callable,
     TYPE_CHECKING,
@@ -195,9 +194,10 @@ class SimulationState(NamedTuple):
         requests = self.requests.values()
         if filter_function and sort:
             return tuple(
-                filter(
-                    filter_function,
-                    sorted(requests, key=sort_key, reverse=sort_reversed),
+                sorted(
+                    filter(filter_function, requests),
+                    key=sort_key,
+                    reverse=sort_reversed,
                 )
             )
         elif filter_function:
@@ -214,19 +214,11 @@ class SimulationState(NamedTuple):
         :param geoid: geoid to look up, should be at the self.sim_h3_location_resolution
         :return: an Optional AtLocationResponse
         """
-        vehicles = self.v_locations[geoid] if geoid in self.v_locations else frozenset()
-        requests = self.r_locations[geoid] if geoid in self.r_locations else frozenset()
-        station = self.s_locations[geoid] if geoid in self.s_locations else frozenset()
-        base = self.b_locations[geoid] if geoid in self.b_locations else frozenset()
-
-        result = cast(
-            AtLocationResponse,
-            {
-                "vehicles": vehicles,
-                "requests": requests,
-                "station": station,
-                "base": base,
-            },
+        result = AtLocationResponse(
+            vehicles=self.v_locations.get(geoid, frozenset()),
+            requests=self.r_locations.get(geoid, frozenset()),
+            station=self.s_locations.get(geoid, frozenset()),
+            base=self.b_locations.get(geoid, frozenset()),
         )
         return result
 
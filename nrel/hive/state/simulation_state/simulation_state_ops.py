@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Iterable, Optional, TYPE_CHECKING, Tuple
+import logging
+from typing import Iterable, List, Optional, TYPE_CHECKING, Tuple
 
 import h3
 from returns.result import Success, Failure, ResultE
@@ -19,12 +20,13 @@ if TYPE_CHECKING:
     from nrel.hive.model.station.station import Station
     from nrel.hive.model.vehicle.vehicle import Vehicle
 
-
 """
 a collection of operations to modify the SimulationState which are not
 intended to be exposed to HIVE users
 """
 
+log = logging.getLogger(__name__)
+
 
 def tick(sim: SimulationState) -> SimulationState:
     """
@@ -183,20 +185,83 @@ def add_request_safe(sim: SimulationState, request: Request) -> ResultE[Simulati
 
     :return: the updated simulation state, or an error
     """
-
-    if not sim.road_network.geoid_within_geofence(request.origin):
+    within_geofence, _ = _split_by_geofence(sim, (request,))
+    if not within_geofence:
         return Failure(
             SimulationStateError(f"origin {request.origin} not within road network geofence")
         )
     else:
-        search_geoid = h3.h3_to_parent(request.geoid, sim.sim_h3_search_resolution)
+        return Success(_insert_requests(sim, within_geofence))
 
-        updated_sim = sim._replace(
-            requests=DictOps.add_to_dict(sim.requests, request.id, request),
-            r_locations=DictOps.add_to_collection_dict(sim.r_locations, request.geoid, request.id),
-            r_search=DictOps.add_to_collection_dict(sim.r_search, search_geoid, request.id),
-        )
-        return Success(updated_sim)
+
+def add_requests(
+    sim: SimulationState, requests: Iterable[Request]
+) -> Tuple[SimulationState, Tuple[Request, ...]]:
+    """
+    adds a batch of requests to the SimulationState. any request with an origin outside of
+    the road network geofence is logged and skipped, and the rest are added.
+
+    :param sim: the simulation state
+    :param requests: the requests to add
+
+    :return: the updated simulation state, along with the requests that were added
+    """
+    within_geofence, outside_geofence = _split_by_geofence(sim, requests)
+    for request in outside_geofence:
+        log.error(f"origin {request.origin} not within road network geofence")
+
+    return _insert_requests(sim, within_geofence), within_geofence
+
+
+def _split_by_geofence(
+    sim: SimulationState, requests: Iterable[Request]
+) -> Tuple[Tuple[Request, ...], Tuple[Request, ...]]:
+    """
+    splits requests by whether their origin is within the road network geofence
+
+    :param sim: the simulation state
+    :param requests: the requests to split
+
+    :return: the requests within the geofence, and the requests outside of it
+    """
+    within: List[Request] = []
+    outside: List[Request] = []
+    for request in requests:
+        if sim.road_network.geoid_within_geofence(request.origin):
+            within.append(request)
+        else:
+            outside.append(request)
+    return tuple(within), tuple(outside)
+
+
+def _insert_requests(sim: SimulationState, requests: Iterable[Request]) -> SimulationState:
+    """
+    inserts requests into the request collections of the SimulationState. the collections are
+    each updated in a single mutation, instead of building new collections for every request.
+
+    :param sim: the simulation state
+    :param requests: the requests to insert, already checked against the road network geofence
+
+    :return: the updated simulation state
+    """
+    with sim.requests.mutate() as updated_requests:
+        with sim.r_locations.mutate() as updated_r_locations:
+            with sim.r_search.mutate() as updated_r_search:
+                for request in requests:
+                    search_geoid = h3.h3_to_parent(request.geoid, sim.sim_h3_search_resolution)
+                    ids_at_location = updated_r_locations.get(request.geoid, frozenset())
+                    ids_at_search = updated_r_search.get(search_geoid, frozenset())
+
+                    updated_requests.set(request.id, request)
+                    updated_r_locations.set(request.geoid, ids_at_location.union([request.id]))
+                    updated_r_search.set(search_geoid, ids_at_search.union([request.id]))
+
+                updated_sim = sim._replace(
+                    requests=updated_requests.finish(),
+                    r_locations=updated_r_locations.finish(),
+                    r_search=updated_r_search.finish(),
+                )
+    return updated_sim
 
 
 def remove_request_safe(sim: SimulationState, request_id: RequestId) -> ResultE[SimulationState]:
@@ -3,7 +3,7 @@ from __future__ import annotations
 import inspect
 import logging
 from dataclasses import dataclass, replace
-from typing import Tuple, TYPE_CHECKING, Type, Union
+from typing import List, Tuple, TYPE_CHECKING, Type, Union
 
 import immutables
 from returns.result import ResultE, Failure, Success
@@ -96,13 +96,14 @@ class StepSimulation(SimulationUpdateFunction):
         )
 
         # pops the top instruction from the stack. this could be replaced with something like a priority queue
-        final_instructions: Tuple[Instruction, ...] = ()
+        popped_instructions: List[Instruction] = []
         for vid in i_stack.keys():
             i, _ = DictOps.pop_from_stack_dict(i_stack, vid)
             if not i:
                 continue
             else:
-                final_instructions = (i,) + final_instructions
+                popped_instructions.append(i)
+        final_instructions = tuple(reversed(popped_instructions))
 
         log_instructions(final_instructions, env, simulation_state.sim_time)
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import functools as ft
 import logging
-from dataclasses import asdict
+from dataclasses import fields
 from typing import List, Tuple, Optional, TYPE_CHECKING, Callable, NamedTuple
 
 from nrel.hive.dispatcher.instruction.instruction import Instruction
@@ -25,7 +25,9 @@ log = logging.getLogger(__name__)
 
 
 def _instruction_to_report(i: Instruction, sim_time: SimTime) -> Report:
-    i_dict = asdict(i)
+    # instruction fields are all ids and tuples of ids, so a shallow copy is sufficient
+    # and avoids the recursive deep copy performed by dataclasses.asdict
+    i_dict = {f.name: getattr(i, f.name) for f in fields(i)}
     i_dict["sim_time"] = sim_time
     i_dict["instruction_type"] = i.__class__.__name__
 
@@ -139,21 +141,24 @@ def apply_instructions(
     # construct the vehicle state transitions
 
     results: List[InstructionResult] = []
-    for instruction in instructions:
-        err, instruction_result = instruction.apply_instruction(sim, env)
-        if err is not None:
-            log.error(err)
-            continue
-        if instruction_result is None:
-            log.error("this should not be none if error is not none")
-            continue
-
-        updated_instructions = sim.applied_instructions.update(
-            {instruction.vehicle_id: instruction}
-        )
-        sim = sim._replace(applied_instructions=updated_instructions)
-
-        results.append(instruction_result)
+    # record all applied instructions in a single mutation of the Map, rather than
+    # building a new Map and SimulationState for each one
+    with sim.applied_instructions.mutate() as applied_instructions:
+        for instruction in instructions:
+            err, instruction_result = instruction.apply_instruction(sim, env)
+            if err is not None:
+                log.error(err)
+                continue
+            if instruction_result is None:
+                log.error("this should not be none if error is not none")
+                continue
+
+            applied_instructions.set(instruction.vehicle_id, instruction)
+
+            results.append(instruction_result)
+        updated_instructions = applied_instructions.finish()
+
+    sim = sim._replace(applied_instructions=updated_instructions)
 
     for instruction_result in results:
         result = entity_state_ops.transition_previous_to_next(
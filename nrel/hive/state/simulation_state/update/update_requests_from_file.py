@@ -1,14 +1,11 @@
 from __future__ import annotations
 
-import functools as ft
 import logging
 from csv import DictReader
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Tuple, Optional, Iterator, Dict
 
-from returns.result import Failure
-
 from nrel.hive.model.request import Request, RequestRateStructure
 from nrel.hive.model.sim_time import SimTime
 from nrel.hive.reporting.reporter import Report, ReportType
@@ -124,21 +121,21 @@ def update_requests_from_iterator(
     :return: sim state plus new requests
     """
 
-    def _update(
-        sim: SimulationState,
+    def _parse(
         row: Dict[str, str],
+        sim: SimulationState,
         env: Environment,
         rate_structure: RequestRateStructure,
-    ) -> SimulationState:
+    ) -> Optional[Request]:
         """
-        takes one row, attempts to parse it as a Request, and attempts to add it to the simulation
+        takes one row and attempts to parse it as a Request that can be added to the simulation
 
 
-        :param sim: latest SimulationState
         :param row: one row as loaded via DictReader
+        :param sim: the current SimulationState
         :param env: the simulation environment
         :param rate_structure: the rate structure for requests in the simulation
-        :return: the updated sim and updated reporting
+        :return: the priced request, or None if the row should not be added
         """
         error, req = Request.from_row(row, env, sim.road_network)
         this_req_cancel_time = (
@@ -146,56 +143,42 @@ def update_requests_from_iterator(
         )
         if error:
             log.error(error)
-            return sim
+            return None
         elif not req:
             log.error(f"an unexpected error occurred with request row: {row}")
-            return sim
+            return None
         elif this_req_cancel_time <= sim.sim_time:
             # cannot add request that should already be cancelled
             current_time = sim.sim_time
             warning = f"request {req.id} with cancel_time {this_req_cancel_time} cannot be added at time {current_time}"
             log.warning(warning)
-            return sim
+            return None
         elif len(env.fleet_ids) > 0 and len(req.membership.memberships) == 0:
             warning = f"request {req.id} is missing membership and will not be be added"
             log.warning(warning)
-            return sim
+            return None
         elif len(env.fleet_ids) == 0 and len(req.membership.memberships) > 0:
             warning = f"request {req.id} has membership but there is no fleets file. This request will not be added"
             log.warning(warning)
-            return sim
+            return None
         else:
-            req_updated = req.assign_value(rate_structure, sim.road_network)
-            sim_or_error = simulation_state_ops.add_request_safe(sim, req_updated)
-            if isinstance(sim, Failure):
-                error = sim_or_error.failure()
-                log.error(error)
-                return sim
-            else:
-                # successfully added request
-                sim_updated = sim_or_error.unwrap()
-                req_in_sim = sim_updated.requests.get(req.id)
-                if not req_in_sim:
-                    warning = (
-                        f"adding new request {req.id} to sim succeeded but now request is not found"
-                    )
-                    log.warning(warning)
-                    return sim
-                else:
-                    dep_t = req_in_sim.departure_time
-                    report_data = {
-                        "request_id": req.id,
-                        "departure_time": str(dep_t),
-                        "fleet_id": str(req.membership),
-                    }
-                    env.reporter.file_report(Report(ReportType.ADD_REQUEST_EVENT, report_data))
-                    return sim_updated
+            return req.assign_value(rate_structure, sim.road_network)
 
     # stream in all Requests that occur before the sim time of the provided SimulationState
-    updated_sim = ft.reduce(
-        ft.partial(_update, env=env, rate_structure=rate_structure),
-        it,
-        initial_sim_state,
-    )
+    # and add them to the simulation as a single batch
+    new_requests = []
+    for row in it:
+        req = _parse(row, initial_sim_state, env, rate_structure)
+        if req is not None:
+            new_requests.append(req)
+
+    updated_sim, added_requests = simulation_state_ops.add_requests(initial_sim_state, new_requests)
+    for req in added_requests:
+        report_data = {
+            "request_id": req.id,
+            "departure_time": str(req.departure_time),
+            "fleet_id": str(req.membership),
+        }
+        env.reporter.file_report(Report(ReportType.ADD_REQUEST_EVENT, report_data))
 
     return updated_sim
@@ -1,14 +1,11 @@
 from __future__ import annotations
 
-import functools as ft
 import logging
 from csv import DictReader
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Tuple, Optional
 
-from returns.result import Failure
-
 from nrel.hive.model.request import RequestRateStructure, Request
 from nrel.hive.reporting.report_type import ReportType
 from nrel.hive.reporting.reporter import Report
@@ -89,24 +86,14 @@ class UpdateRequestsSampling(SimulationUpdateFunction):
             for r in self.request_iterator
         )
 
-        def _add_request(sim: SimulationState, request: Request) -> SimulationState:
-            # add request and handle any errors
-
-            new_sim_or_error = simulation_state_ops.add_request_safe(sim, request)
-            if isinstance(new_sim_or_error, Failure):
-                error = new_sim_or_error.failure()
-                log.error(error)
-                return sim
-            else:
-                new_sim = new_sim_or_error.unwrap()
-                report_data = {
-                    "request_id": request.id,
-                    "departure_time": str(request.departure_time),
-                    "fleet_id": str(request.membership),
-                }
-                env.reporter.file_report(Report(ReportType.ADD_REQUEST_EVENT, report_data))
-            return new_sim
-
-        updated_sim = ft.reduce(_add_request, priced_requests, sim_state)
+        # add all requests for this time step in a single batch
+        updated_sim, added_requests = simulation_state_ops.add_requests(sim_state, priced_requests)
+        for request in added_requests:
+            report_data = {
+                "request_id": request.id,
+                "departure_time": str(request.departure_time),
+                "fleet_id": str(request.membership),
+            }
+            env.reporter.file_report(Report(ReportType.ADD_REQUEST_EVENT, report_data))
 
         return updated_sim, self
@@ -48,9 +48,6 @@ class VehicleStateABC(ABC):
         """
         pass
 
-    def __repr__(self) -> str:
-        return super().__repr__()
-
     @classmethod
     def default_update(
         mcs, sim: SimulationState, env: Environment, state: VehicleState
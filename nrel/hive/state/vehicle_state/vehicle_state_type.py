@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 from enum import Enum
+from typing import Optional
 
 
 class VehicleStateType(Enum):
@@ -18,3 +21,17 @@ class VehicleStateType(Enum):
     DISPATCH_STATION = 30
     CHARGING_STATION = 31
     CHARGE_QUEUEING = 32
+
+    @classmethod
+    def from_string(cls, s: str) -> Optional[VehicleStateType]:
+        """
+        finds the state type for a vehicle state name, such as "idle", "Idle" or "charging_station";
+        names are matched case-insensitively against the vehicle state class names
+
+        :param s: the vehicle state name
+        :return: the matching vehicle state type, or None if no state has that name
+        """
+        return _VEHICLE_STATE_TYPES_BY_NAME.get(s.replace("_", "").lower())
+
+
+_VEHICLE_STATE_TYPES_BY_NAME = {t.name.replace("_", "").lower(): t for t in VehicleStateType}
@@ -1,5 +1,7 @@
+import copy
+import functools
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 import pkg_resources
 import yaml
@@ -64,6 +66,28 @@ def global_hive_config_search() -> GlobalConfig:
         return GlobalConfig.from_dict(default, default_global_config_file_path)
 
 
+def load_yaml_file(file: Union[str, Path]) -> Any:
+    """
+    loads a yaml asset file, parsing each file only once while it is unchanged on disk. assets such as
+    powertrain and powercurve files are typically shared by many mechatronics types, so this avoids
+    re-opening and re-parsing the same file for each one.
+
+    :param file: the yaml file to load
+    :return: a fresh copy of the parsed file contents, safe for the caller to modify
+    :raises: FileNotFoundError if the file does not exist
+    """
+    path = Path(file)
+    mtime_ns = path.stat().st_mtime_ns
+    return copy.deepcopy(_parse_yaml_file(str(path.absolute()), mtime_ns))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_yaml_file(file: str, mtime_ns: int) -> Any:
+    # the modification time is part of the cache key so edited files are parsed again
+    with Path(file).open() as f:
+        return yaml.safe_load(f)
+
+
 def construct_asset_path(
     file: Union[str, Path],
     scenario_directory: Union[str, Path],
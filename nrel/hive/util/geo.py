@@ -23,12 +23,13 @@ def same_simulation_location(
         :param override_resolution: an overriding h3 spatial resolution, or, none to use this sim's default res
         :return: True/False, or, a SimulationStateError
     """
-    if override_resolution is None:
+    if override_resolution is None or override_resolution == sim_h3_resolution:
         return a == b
     elif override_resolution > sim_h3_resolution:
         return False
-    elif override_resolution == sim_h3_resolution:
-        return a == b
+    elif a == b:
+        # identical geoids share every parent, no need to compute them
+        return True
 
     a_parent = h3.h3_to_parent(a, override_resolution)
     b_parent = h3.h3_to_parent(b, override_resolution)
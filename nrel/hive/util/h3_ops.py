@@ -1,6 +1,18 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, TYPE_CHECKING, FrozenSet, Iterable, Callable, Tuple
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 import h3
 import immutables
@@ -15,6 +27,50 @@ if TYPE_CHECKING:
     from nrel.hive.model.roadnetwork.linktraversal import LinkTraversal
 
 
+@lru_cache(maxsize=2**16)
+def _geoid_to_radians(geoid: GeoId) -> Tuple[float, float, float]:
+    """
+    converts a geoid to its centroid latitude and longitude in radians, along with the cosine
+    of the latitude. geoids repeat heavily across distance calculations, so these are cached.
+
+    :param geoid: the geoid to convert
+    :return: the latitude and longitude in radians, and the cosine of the latitude
+    """
+    lat, lon = h3.h3_to_geo(geoid)
+    lat_rad = radians(lat)
+    return lat_rad, radians(lon), cos(lat_rad)
+
+
+def _search_rings(
+    search_geoid: GeoId, max_k: int, occupied_cells: Collection[GeoId]
+) -> Iterable[Iterable[GeoId]]:
+    """
+    groups the search cells within max_k of the search origin by their ring distance. when
+    fewer cells are occupied than there are cells in the disk, only the occupied cells are
+    placed into rings, which avoids building every ring of a large search radius.
+
+    :param search_geoid: the search origin, at the search resolution
+    :param max_k: the number of rings around the origin to search
+    :param occupied_cells: the search cells holding any entities
+    :return: the cells of each ring, from the origin outward
+    """
+    disk_size = 3 * max_k * (max_k + 1) + 1
+    if len(occupied_cells) >= disk_size:
+        return h3.k_ring_distances(search_geoid, max_k)
+
+    rings: List[List[GeoId]] = [[] for _ in range(max_k + 1)]
+    for cell in occupied_cells:
+        try:
+            k = h3.h3_distance(search_geoid, cell)
+        except ValueError:
+            # grid distance is undefined across some pentagon distortions, even for
+            # cells within max_k, so answer with the rings of the full disk instead
+            return h3.k_ring_distances(search_geoid, max_k)
+        if k <= max_k:
+            rings[k].append(cell)
+    return rings
+
+
 class H3Ops:
     @classmethod
     def nearest_entity_by_great_circle_distance(
@@ -86,46 +142,48 @@ class H3Ops:
         max_k = ceil(max_search_distance_km / k_dist_km)
         search_geoid = h3.h3_to_parent(geoid, sim_h3_search_resolution)
 
-        def _search(current_k: int = 0) -> Optional[Entity]:
-            if current_k > max_k:
-                # There are no entities in any of the rings.
-                return None
-            else:
-                # get the kth ring
-                ring = h3.k_ring(search_geoid, current_k)
-
-                # get all entities in this ring
-                found = (
-                    entity
-                    for cell in ring
-                    for entity in cls.get_entities_at_cell(cell, entity_search, entities)
-                )
-
-                best_dist_km = 1000000.0
-                best_entity = None
-
-                count = 0
-                for entity in found:
+        # index the entities by id once so each search cell is a lookup instead of a full scan
+        entity_index = cls.index_entities(entities)
+
+        # all search cells within max_k, grouped by ring distance from the search origin
+        rings = _search_rings(search_geoid, max_k, entity_search.keys())
+
+        best_dist_km = 1000000.0
+        best_entity = None
+        for ring in rings:
+            # disks of smaller k were already searched, so only the new ring is evaluated
+            for cell in sorted(ring):
+                for entity in cls.get_entities_at_cell(cell, entity_search, entity_index):
+                    if not is_valid(entity):
+                        continue
                     dist_km = distance_function(entity)
-                    if is_valid(entity) and dist_km < best_dist_km:
+                    if dist_km < best_dist_km:
                         best_dist_km = dist_km
                         best_entity = entity
-                    count += 1
 
-                if best_entity is not None:
-                    # print(f"ring search depth {current_k} found {count} agents, best agent at dist {best_dist} km")
-                    return best_entity
-                else:
-                    return _search(current_k + 1)
+            if best_entity is not None:
+                return best_entity
 
-        return _search()
+        # there are no entities in any of the rings
+        return None
+
+    @classmethod
+    def index_entities(cls, entities: Iterable[Entity]) -> Dict[EntityId, Tuple[int, Entity]]:
+        """
+        indexes a collection of entities by id, retaining each entity's position in the collection
+
+
+        :param entities: the entities to index
+        :return: a lookup from entity id to the entity's position and the entity
+        """
+        return {e.id: (i, e) for i, e in enumerate(entities)}
 
     @classmethod
     def get_entities_at_cell(
         cls,
         search_cell: GeoId,
         entity_search: immutables.Map[GeoId, FrozenSet[EntityId]],
-        entities: Iterable[Entity],
+        entity_index: Dict[EntityId, Tuple[int, Entity]],
     ) -> Tuple[Entity, ...]:
         """
         gives us entities within a high-level search cell
@@ -133,15 +191,15 @@ class H3Ops:
 
         :param search_cell: the search-level h3 position we are looking at
         :param entity_search: the upper-level search collection for this entity type
-        :param entities: the actual entities
-        :return: any entities which are located at this search-level cell
+        :param entity_index: the actual entities, as built by H3Ops.index_entities
+        :return: any entities which are located at this search-level cell, in collection order
         """
         locations_at_cell = entity_search.get(search_cell)
         if locations_at_cell is None:
             return ()
         else:
-            found = tuple(e for e in entities if e.id in locations_at_cell)
-            return found
+            found = sorted(entity_index[e_id] for e_id in locations_at_cell if e_id in entity_index)
+            return tuple(e for _, e in found)
 
     @classmethod
     def nearest_entity_point_to_point(
@@ -188,16 +246,13 @@ class H3Ops:
         """
         avg_earth_radius_km = 6371
 
-        lat1, lon1 = h3.h3_to_geo(a)
-        lat2, lon2 = h3.h3_to_geo(b)
-
-        # convert all latitudes/longitudes from decimal degrees to radians
-        lat1, lon1, lat2, lon2 = map(radians, (lat1, lon1, lat2, lon2))
+        lat1, lon1, cos_lat1 = _geoid_to_radians(a)
+        lat2, lon2, cos_lat2 = _geoid_to_radians(b)
 
         # calculate haversine
         lat = lat2 - lat1
         lon = lon2 - lon1
-        d = sin(lat * 0.5) ** 2 + cos(lat1) * cos(lat2) * sin(lon * 0.5) ** 2
+        d = sin(lat * 0.5) ** 2 + cos_lat1 * cos_lat2 * sin(lon * 0.5) ** 2
 
         return 2 * avg_earth_radius_km * asin(sqrt(d))
 
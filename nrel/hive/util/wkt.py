@@ -1,4 +1,3 @@
-import functools as ft
 from typing import Tuple
 
 
@@ -49,12 +48,6 @@ def linestring_2d(points: Tuple[Tuple[float, float], ...], x_y_ordering: bool) -
     elif len(points) == 1:
         return point_2d(points[0], x_y_ordering)
     else:
-        initial: Tuple[str, ...] = tuple()
-        pts_strings = ft.reduce(
-            lambda acc, pair: acc + (f"{_point_to_string(pair, x_y_ordering)}",),
-            points,
-            initial,
-        )
-        inner_content = ", ".join(pts_strings)
+        inner_content = ", ".join(_point_to_string(pair, x_y_ordering) for pair in points)
         linestring = f"LINESTRING ({inner_content})"
         return linestring
@@ -64,6 +64,23 @@ class TestBEV(TestCase):
             places=0,
         )
 
+    def test_powertrain_energy_cost_multi_link_route(self):
+        powertrain = mock_ev_powertrain(nominal_watt_hour_per_mile=225)
+        links = tuple(mock_graph_links().values())
+        zero_length = Link.build("4", links[-1].end, links[-1].end, speed_kmph=30)
+        # mixed speeds, including speeds beyond the ends of the lookup table
+        route = (
+            links[0].update_speed(0),
+            links[1].update_speed(45),
+            zero_length,
+            links[2].update_speed(200),
+        )
+
+        expected = sum(powertrain.link_cost(link) for link in route)
+        self.assertEqual(zero_length.distance_km, 0)
+        self.assertGreater(expected, 0)
+        self.assertAlmostEqual(powertrain.energy_cost(route), expected, places=9)
+
     def test_remaining_range(self):
         bev = mock_bev(battery_capacity_kwh=50, nominal_watt_hour_per_mile=1000)
         vehicle = mock_vehicle(soc=1)
@@ -6,7 +6,7 @@ from unittest import TestCase
 import yaml
 
 from nrel.hive.config.global_config import GlobalConfig
-from nrel.hive.util.fs import global_hive_config_search
+from nrel.hive.util.fs import global_hive_config_search, load_yaml_file
 
 
 class TestDictReaderStepper(TestCase):
@@ -38,3 +38,29 @@ class TestDictReaderStepper(TestCase):
                     "should also contain keys from the default config",
                 )
                 os.chdir(original_dir)
+
+    def test_load_yaml_file_returns_independent_copies(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            file = Path(tmp).joinpath("asset.yaml")
+            with open(file, "w") as f:
+                yaml.safe_dump({"type": "tabular", "table": [1, 2]}, f)
+
+            first = load_yaml_file(file)
+            first["table"].append(3)
+            second = load_yaml_file(file)
+
+            self.assertEqual(second, {"type": "tabular", "table": [1, 2]}, "should not share state")
+
+    def test_load_yaml_file_reloads_changed_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            file = Path(tmp).joinpath("asset.yaml")
+            with open(file, "w") as f:
+                yaml.safe_dump({"type": "tabular"}, f)
+            load_yaml_file(file)
+
+            with open(file, "w") as f:
+                yaml.safe_dump({"type": "updated"}, f)
+            stat = file.stat()
+            os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            self.assertEqual(load_yaml_file(file), {"type": "updated"}, "should re-read the file")
@@ -69,6 +69,78 @@ class TestH3Ops(TestCase):
 
         self.assertEqual(nearest.geoid, req_near.geoid)
 
+    def test_nearest_entity_tie_returns_first_entity(self):
+        somewhere = h3.geo_to_h3(39.7539, -104.974, 15)
+        req_a = mock_request_from_geoids(request_id="a", origin=somewhere)
+        req_b = mock_request_from_geoids(request_id="b", origin=somewhere)
+
+        sim = mock_sim()
+        sim_with_reqs, _ = simulation_state_ops.add_requests(sim, (req_a, req_b))
+
+        for entities in [(req_a, req_b), (req_b, req_a)]:
+            nearest = H3Ops.nearest_entity_by_great_circle_distance(
+                geoid=somewhere,
+                entities=entities,
+                entity_search=sim_with_reqs.r_search,
+                sim_h3_search_resolution=sim_with_reqs.sim_h3_search_resolution,
+            )
+            self.assertEqual(nearest.id, entities[0].id, "ties go to the first entity")
+
+    def test_nearest_entity_large_search_radius(self):
+        somewhere = h3.geo_to_h3(39.7539, -104.974, 15)
+        near_to_somewhere = h3.geo_to_h3(39.7, -104.9, 15)
+        far_from_somewhere = h3.geo_to_h3(39.5, -104.6, 15)
+        req_near = mock_request_from_geoids(request_id="near", origin=near_to_somewhere)
+        req_far = mock_request_from_geoids(request_id="far", origin=far_from_somewhere)
+        # too far away for h3 to measure a grid distance to
+        tokyo = h3.geo_to_h3(35.6762, 139.6503, 15)
+        req_tokyo = mock_request_from_geoids(request_id="tokyo", origin=tokyo)
+
+        sim = mock_sim(h3_search_res=7)
+        sim_with_reqs, _ = simulation_state_ops.add_requests(sim, (req_far, req_near, req_tokyo))
+
+        def _nearest(max_search_distance_km):
+            return H3Ops.nearest_entity_by_great_circle_distance(
+                geoid=somewhere,
+                entities=tuple(sim_with_reqs.requests.values()),
+                entity_search=sim_with_reqs.r_search,
+                sim_h3_search_resolution=sim_with_reqs.sim_h3_search_resolution,
+                max_search_distance_km=max_search_distance_km,
+            )
+
+        self.assertEqual(
+            _nearest(100).id, "near", "should find the nearest of the distant entities"
+        )
+        self.assertIsNone(_nearest(1), "both entities are beyond the search radius")
+
+    def test_nearest_entity_next_to_pentagon(self):
+        search_res = 9
+        pentagon = sorted(h3.get_pentagon_indexes(search_res))[0]
+        origin = sorted(h3.k_ring(pentagon, 1) - {pentagon})[0]
+
+        def _unmeasurable(cell):
+            try:
+                h3.h3_distance(origin, cell)
+                return False
+            except ValueError:
+                return True
+
+        # a cell within the search disk that h3_distance cannot measure across the pentagon
+        cell = sorted(c for c in h3.k_ring(origin, 2) if _unmeasurable(c))[0]
+        req = mock_request_from_geoids(origin=h3.h3_to_center_child(cell, 15))
+        sim, _ = simulation_state_ops.add_requests(mock_sim(h3_search_res=search_res), (req,))
+
+        nearest = H3Ops.nearest_entity_by_great_circle_distance(
+            geoid=h3.h3_to_center_child(origin, 15),
+            entities=tuple(sim.requests.values()),
+            entity_search=sim.r_search,
+            sim_h3_search_resolution=search_res,
+            max_search_distance_km=h3.edge_length(search_res, unit="km") * 2 * 3,
+        )
+
+        self.assertIsNotNone(nearest, "the entity is within the search disk")
+        self.assertEqual(nearest.id, req.id)
+
     def test_great_circle_distance(self):
         london = h3.geo_to_h3(51.5007, 0.1246, 10)
         new_york = h3.geo_to_h3(40.6892, 74.0445, 10)
@@ -50,6 +50,26 @@ class TestICE(TestCase):
             places=0,
         )
 
+    def test_energy_cost_tracks_energy_expended(self):
+        ice = mock_ice(tank_capacity_gallons=10, nominal_miles_per_gallon=10)
+        vehicle = mock_vehicle(soc=1, mechatronics=ice)
+
+        moved_vehicle = ice.consume_energy(vehicle, route=mock_route())
+        used_gal_gas = 10 - moved_vehicle.energy[EnergyType.GASOLINE]
+
+        self.assertGreater(used_gal_gas, 0, "moving should use fuel")
+        self.assertAlmostEqual(moved_vehicle.energy_expended[EnergyType.GASOLINE], used_gal_gas)
+
+    def test_idle_uses_fuel(self):
+        ice = mock_ice(tank_capacity_gallons=10)
+        vehicle = mock_vehicle(soc=1, mechatronics=ice)
+
+        idle_vehicle = ice.idle(vehicle, hours_to_seconds(1))
+        used_gal_gas = 10 - idle_vehicle.energy[EnergyType.GASOLINE]
+
+        self.assertGreater(used_gal_gas, 0, "idling should use fuel")
+        self.assertAlmostEqual(idle_vehicle.energy_expended[EnergyType.GASOLINE], used_gal_gas)
+
     def test_remaining_range(self):
         ice = mock_ice(tank_capacity_gallons=10, nominal_miles_per_gallon=10)
         vehicle = mock_vehicle(soc=1, mechatronics=ice)
@@ -1,6 +1,8 @@
 from unittest import TestCase
 
+from nrel.hive.dispatcher.instruction_generator import assignment_ops
 from nrel.hive.resources.mock_lobster import *
+from nrel.hive.state.vehicle_state.out_of_service import OutOfService
 
 
 class TestInstructionGenerators(TestCase):
@@ -64,6 +66,182 @@ class TestInstructionGenerators(TestCase):
             "There are no vehicles to make assignments to.",
         )
 
+    def test_dispatcher_only_dispatches_valid_states(self):
+        dispatcher = Dispatcher(mock_config().dispatcher)
+
+        somewhere = h3.geo_to_h3(39.7539, -104.974, 15)
+        near_to_somewhere = h3.geo_to_h3(39.754, -104.975, 15)
+        far_from_somewhere = h3.geo_to_h3(39.755, -104.976, 15)
+
+        req = mock_request_from_geoids(origin=somewhere)
+        out_of_service_veh = mock_vehicle_from_geoid(
+            vehicle_id="out_of_service_veh",
+            geoid=near_to_somewhere,
+            vehicle_state=OutOfService.build("out_of_service_veh"),
+        )
+        idle_veh = mock_vehicle_from_geoid(vehicle_id="idle_veh", geoid=far_from_somewhere)
+        sim = mock_sim(
+            h3_location_res=9,
+            h3_search_res=9,
+            vehicles=(out_of_service_veh, idle_veh),
+        )
+        sim = simulation_state_ops.add_request_safe(sim, req).unwrap()
+
+        dispatcher, instructions = dispatcher.generate_instructions(sim, mock_env())
+
+        self.assertEqual(len(instructions), 1, "should have dispatched one vehicle")
+        self.assertEqual(
+            instructions[0].vehicle_id,
+            idle_veh.id,
+            "out of service vehicles are not valid for dispatch",
+        )
+
+    def test_dispatcher_ignores_vehicles_beyond_search_radius(self):
+        config = mock_config()
+        env = mock_env(
+            config=config._replace(dispatcher=config.dispatcher._replace(max_search_radius_km=1.0))
+        )
+        dispatcher = Dispatcher(env.config.dispatcher)
+
+        somewhere = h3.geo_to_h3(39.7539, -104.974, 15)
+        far_from_somewhere = h3.geo_to_h3(39.7, -104.9, 15)
+
+        req = mock_request_from_geoids(origin=somewhere)
+        far_veh = mock_vehicle_from_geoid(vehicle_id="far_veh", geoid=far_from_somewhere)
+        sim = mock_sim(h3_location_res=9, h3_search_res=9, vehicles=(far_veh,))
+        sim = simulation_state_ops.add_request_safe(sim, req).unwrap()
+
+        dispatcher, instructions = dispatcher.generate_instructions(sim, env)
+
+        self.assertEqual(
+            len(instructions),
+            0,
+            "The only vehicle is outside of the search radius.",
+        )
+
+    def test_h3_search_candidates_ring_and_distance_probes_agree(self):
+        search_res = 9
+        k_dist_km = h3.edge_length(search_res, unit="km") * 2
+
+        def _vehicles(cells, prefix):
+            return tuple(
+                mock_vehicle_from_geoid(
+                    vehicle_id=f"{prefix}_{i}", geoid=h3.h3_to_center_child(c, 15)
+                )
+                for i, c in enumerate(cells)
+            )
+
+        def _candidates(origin, vehicles, max_k):
+            req = mock_request_from_geoids(origin=h3.h3_to_center_child(origin, 15))
+            sim = mock_sim(h3_search_res=search_res, vehicles=vehicles)
+            sim = simulation_state_ops.add_request_safe(sim, req).unwrap()
+            return assignment_ops.h3_search_candidates(
+                vehicles,
+                (req,),
+                sim.v_search,
+                sim.r_search,
+                search_res,
+                max_k * k_dist_km,
+            )
+
+        def _expected(origin, vehicles, max_k):
+            ring = h3.k_ring(origin, max_k)
+            return {
+                (i, 0)
+                for i, v in enumerate(vehicles)
+                if h3.h3_to_parent(v.geoid, search_res) in ring
+            }
+
+        origin = h3.geo_to_h3(39.7539, -104.974, search_res)
+        # an unmeasurably distant vehicle, which h3_distance raises on
+        tokyo = h3.geo_to_h3(35.6762, 139.6503, search_res)
+        disk = tuple(sorted(h3.k_ring(origin, 2)))
+        vehicles = _vehicles(disk + (tokyo,), "veh")
+
+        # small radius, many occupied cells: probes the 7 cells of the ring
+        small = _candidates(origin, vehicles, max_k=1)
+        self.assertEqual(set(small), _expected(origin, vehicles, max_k=1))
+        self.assertEqual(len(small), 7)
+
+        # larger radius, few occupied cells: measures each occupied cell by grid distance
+        large = _candidates(origin, vehicles, max_k=3)
+        self.assertEqual(set(large), _expected(origin, vehicles, max_k=3))
+        self.assertEqual(len(large), 19)
+
+        # padding the fleet with out-of-range cells flips the same search to probing the ring
+        padding = tuple(sorted(h3.k_ring(origin, 6) - h3.k_ring(origin, 3)))
+        padded = _candidates(origin, vehicles + _vehicles(padding, "pad"), max_k=3)
+        self.assertEqual(set(padded), set(large))
+
+        # next to a pentagon, h3_distance raises for some cells that are inside the k-ring
+        pentagon = sorted(h3.get_pentagon_indexes(search_res))[0]
+        near_pentagon = sorted(h3.k_ring(pentagon, 1) - {pentagon})[0]
+        pentagon_disk = tuple(sorted(h3.k_ring(near_pentagon, 3)))
+        pentagon_vehicles = _vehicles(pentagon_disk, "pent")
+
+        distance_probe = _candidates(near_pentagon, pentagon_vehicles, max_k=3)
+        self.assertEqual(len(distance_probe), len(pentagon_disk))
+        self.assertEqual(set(distance_probe), _expected(near_pentagon, pentagon_vehicles, 3))
+
+        pentagon_padding = tuple(sorted(h3.k_ring(near_pentagon, 6) - h3.k_ring(near_pentagon, 3)))
+        padded_vehicles = pentagon_vehicles + _vehicles(pentagon_padding, "pad")
+        ring_probe = _candidates(near_pentagon, padded_vehicles, max_k=3)
+        self.assertEqual(set(ring_probe), set(distance_probe))
+
+    def test_dispatcher_multi_membership_vehicle_dispatched_once(self):
+        env = mock_env(fleet_ids=frozenset(["fleet_a", "fleet_b"]))
+        dispatcher = Dispatcher(env.config.dispatcher)
+
+        somewhere = h3.geo_to_h3(39.7539, -104.974, 15)
+        near_to_somewhere = h3.geo_to_h3(39.754, -104.975, 15)
+
+        req_a = mock_request_from_geoids(request_id="req_a", origin=somewhere, fleet_id="fleet_a")
+        req_b = mock_request_from_geoids(request_id="req_b", origin=somewhere, fleet_id="fleet_b")
+        veh = mock_vehicle_from_geoid(
+            geoid=near_to_somewhere,
+            membership=Membership.from_tuple(("fleet_a", "fleet_b")),
+        )
+        sim = mock_sim(h3_location_res=9, h3_search_res=9, vehicles=(veh,))
+        sim = simulation_state_ops.add_request_safe(sim, req_a).unwrap()
+        sim = simulation_state_ops.add_request_safe(sim, req_b).unwrap()
+
+        dispatcher, instructions = dispatcher.generate_instructions(sim, env)
+
+        self.assertEqual(
+            len(instructions),
+            1,
+            "A vehicle in both fleets should only be dispatched to one request.",
+        )
+
+    def test_dispatcher_multi_membership_request_assigned_once(self):
+        env = mock_env(fleet_ids=frozenset(["fleet_a", "fleet_b"]))
+        dispatcher = Dispatcher(env.config.dispatcher)
+
+        somewhere = h3.geo_to_h3(39.7539, -104.974, 15)
+        near_to_somewhere = h3.geo_to_h3(39.754, -104.975, 15)
+
+        req = mock_request_from_geoids(origin=somewhere).set_membership(("fleet_a", "fleet_b"))
+        veh_a = mock_vehicle_from_geoid(
+            vehicle_id="veh_a",
+            geoid=near_to_somewhere,
+            membership=Membership.single_membership("fleet_a"),
+        )
+        veh_b = mock_vehicle_from_geoid(
+            vehicle_id="veh_b",
+            geoid=near_to_somewhere,
+            membership=Membership.single_membership("fleet_b"),
+        )
+        sim = mock_sim(h3_location_res=9, h3_search_res=9, vehicles=(veh_a, veh_b))
+        sim = simulation_state_ops.add_request_safe(sim, req).unwrap()
+
+        dispatcher, instructions = dispatcher.generate_instructions(sim, env)
+
+        self.assertEqual(
+            len(instructions),
+            1,
+            "A request in both fleets should only be assigned one vehicle.",
+        )
+
     def test_charging_fleet_manager(self):
         charging_fleet_manager = ChargingFleetManager(mock_config().dispatcher)
 
@@ -1,9 +1,21 @@
+import json
+import tempfile
+from pathlib import Path
 from unittest import TestCase
 
 import h3
 
-from nrel.hive.resources.mock_lobster import DefaultIds, mock_sim, somewhere, somewhere_else
+from nrel.hive.resources.mock_lobster import (
+    DefaultIds,
+    mock_runner_payload,
+    mock_sim,
+    mock_vehicle,
+    somewhere,
+    somewhere_else,
+)
 from nrel.hive.reporting.handler.kepler_feature import Coord, Feature, KeplerFeature
+from nrel.hive.reporting.handler.kepler_handler import KeplerHandler
+from nrel.hive.state.vehicle_state.out_of_service import OutOfService
 
 
 class TestKeplerFeature(TestCase):
@@ -75,3 +87,22 @@ class TestKeplerFeature(TestCase):
             mock_sim().sim_time + 2, feature.starttime, "Start time did not get updated"
         )
         self.assertEqual(DefaultIds.mock_vehicle_id(), feature.id, "ID should not change in reset")
+
+    def test_kepler_handler_writes_feature_collection(self):
+        vehicle = mock_vehicle()
+        idle_payload = mock_runner_payload()._replace(s=mock_sim(vehicles=(vehicle,)))
+        moved_vehicle = vehicle.modify_vehicle_state(OutOfService.build(vehicle.id))
+        moved_payload = idle_payload._replace(s=mock_sim(sim_time=1, vehicles=(moved_vehicle,)))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            handler = KeplerHandler(Path(tmp))
+            handler.handle([], idle_payload)
+            handler.handle([], moved_payload)
+            handler.close(moved_payload)
+
+            with Path(tmp).joinpath("kepler.json").open() as f:
+                kepler = json.load(f)
+
+        self.assertEqual(kepler["type"], "FeatureCollection")
+        states = [feature["properties"]["vehicle_state"] for feature in kepler["features"]]
+        self.assertEqual(states, ["Idle", "OutOfService"], "should write one feature per state")
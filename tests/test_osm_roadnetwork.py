@@ -51,3 +51,18 @@ class TestOSMRoadNetwork(TestCase):
             route[-1].end,
             "route should end at destination GeoId (stationary road network location)",
         )
+
+    def test_route_links_are_contiguous(self):
+        sim_h3_resolution = 15
+        network = mock_osm_network(h3_res=sim_h3_resolution)
+
+        origin = h3.geo_to_h3(39.7481388, -104.9935966, sim_h3_resolution)
+        destination = h3.geo_to_h3(39.7613596, -104.981728, sim_h3_resolution)
+
+        route = network.route(
+            network.position_from_geoid(origin), network.position_from_geoid(destination)
+        )
+
+        self.assertGreater(len(route), 2, "route should traverse several links")
+        for prev_link, next_link in zip(route, route[1:]):
+            self.assertEqual(prev_link.end, next_link.start, "each link should follow the last")
@@ -1,7 +1,15 @@
 from unittest import TestCase
 
-from nrel.hive.resources.mock_lobster import mock_bev, mock_vehicle, mock_dcfc_charger
+import numpy as np
+
+from nrel.hive.resources.mock_lobster import (
+    mock_bev,
+    mock_vehicle,
+    mock_dcfc_charger,
+    mock_powercurve,
+)
 from nrel.hive.model.vehicle.mechatronics.powercurve.powercurve_ops import time_to_full
+from nrel.hive.model.vehicle.mechatronics.powercurve.tabular_powercurve import _interp
 
 
 class TestPowercurveOps(TestCase):
@@ -50,3 +58,18 @@ class TestPowercurveOps(TestCase):
             min_delta_energy_change=0.0001,
             max_iterations=10_000,
         )
+
+    def test_interp_matches_numpy(self):
+        powercurve = mock_powercurve()
+        xp = powercurve._charging_energy_kwh_values
+        fp = powercurve._charging_rate_kw_values
+
+        midpoints = [(a + b) / 2 for a, b in zip(xp, xp[1:])]
+        below_and_above = [xp[0] - 10, xp[0] - 1e-9, xp[-1] + 1e-9, xp[-1] + 10]
+        for x in list(xp) + midpoints + below_and_above:
+            self.assertAlmostEqual(
+                _interp(x, xp, fp),
+                float(np.interp(x, xp, fp)),
+                places=9,
+                msg=f"interpolation at {x} should match numpy",
+            )
@@ -31,6 +31,12 @@ class TestRouteTraversal(TestCase):
         self.assertEqual(len(result.remaining_route), 2, "should have 2 links remaining")
         self.assertEqual(len(result.experienced_route), 2, "should have traversed 2 links")
 
+    def test_traverse_without_time_keeps_route(self):
+        links = mock_route()
+        _, result = traverse(route_estimate=links, duration_seconds=0)
+        self.assertEqual(result.remaining_route, links, "should not have moved along the route")
+        self.assertEqual(len(result.experienced_route), 0, "should have traversed no links")
+
     def test_traverse_up_to_split(self):
         links = mock_route()
         test_link = links[0]
@@ -61,6 +61,22 @@ class TestSampleVehicles(TestCase):
         self.assertEqual(len(result.unwrap().vehicles), n, f"should have {n} vehicles")
         map(check_vehicle, result.unwrap().vehicles.values())
 
+    def test_location_sampling_fn_follows_road_network(self):
+        loc_fn = build_default_location_sampling_fn(seed=7)
+        network = mock_osm_network()
+        sim = mock_sim(road_network=network)
+
+        for _ in range(10):
+            link = loc_fn(sim)
+            self.assertIn(link.link_id, network.link_helper.links, "should sample a network link")
+
+        other_network = mock_osm_network(h3_res=14)
+        other_sim = mock_sim(road_network=other_network, h3_location_res=14)
+        link = loc_fn(other_sim)
+        self.assertEqual(
+            link, other_network.link_helper.links[link.link_id], "should sample the new network"
+        )
+
     def test_sample_n_with_failure(self):
         """
         this test is really just here to help demonstrate the Returns library.
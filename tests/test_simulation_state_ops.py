@@ -92,6 +92,40 @@ class TestSimulationStateOps(TestCase):
         self.assertEqual(len(at_loc), 1, "should only have 1 request at this location")
         self.assertIn(req.id, at_loc, "the request's id should be found at it's geoid")
 
+    def test_add_requests(self):
+        req1 = mock_request(request_id="r1")
+        req2 = mock_request(request_id="r2")
+        sim = mock_sim()
+        sim_with_reqs, _ = simulation_state_ops.add_requests(sim, (req1, req2))
+        self.assertEqual(
+            len(sim.requests),
+            0,
+            "the original sim object should not have been mutated",
+        )
+        self.assertEqual(len(sim_with_reqs.requests), 2, "should have added both requests")
+
+        at_loc = sim_with_reqs.r_locations[req1.origin]
+        self.assertEqual(at_loc, frozenset(["r1", "r2"]), "both requests share an origin")
+
+        search_geoid = h3.h3_to_parent(req1.origin, sim.sim_h3_search_resolution)
+        self.assertEqual(sim_with_reqs.r_search[search_geoid], frozenset(["r1", "r2"]))
+
+    def test_add_requests_skips_requests_outside_geofence(self):
+        inside = mock_request(request_id="inside")
+        outside = mock_request_from_geoids(request_id="outside", origin=h3.geo_to_h3(0, 0, 15))
+
+        class FencedNetwork(HaversineRoadNetwork):
+            def geoid_within_geofence(self, geoid: GeoId) -> bool:
+                return geoid != outside.origin
+
+        network = FencedNetwork(geofence=mock_geofence(), sim_h3_resolution=15)
+        sim = mock_sim(road_network=network)
+        sim_with_reqs, added = simulation_state_ops.add_requests(sim, (inside, outside))
+
+        self.assertEqual(added, (inside,), "only the request inside the geofence is added")
+        self.assertEqual(set(sim_with_reqs.requests.keys()), {"inside"})
+        self.assertNotIn(outside.origin, sim_with_reqs.r_locations)
+
     def test_remove_request(self):
         req = mock_request()
         sim = mock_sim()
@@ -34,6 +34,17 @@ class TestVehicle(TestCase):
         with self.assertRaises(IOError):
             Vehicle.from_row(row, road_network, env)
 
+    def test_from_row_missing_initial_soc(self):
+        source = """vehicle_id,lat,lon,mechatronics_id
+                    v1,39.7539,-104.976,bev"""
+
+        row = next(DictReader(source.split()))
+        road_network = mock_network()
+        env = mock_env()
+
+        with self.assertRaises(IOError):
+            Vehicle.from_row(row, road_network, env)
+
     def test_set_membership(self):
         source = """vehicle_id,lat,lon,mechatronics_id,initial_soc,schedule_id,home_base_id
                             v1,39.7539,-104.976,bev,1.0,schedule0,hb1"""